@@ -38,6 +38,7 @@ from integration.runtime.edge_runtime import (
     start_edge_event_receiver,
 )
 from integration.runtime.health_runtime import start_health_server, stop_health_server
+from integration.runtime.visualization_runtime import close_global_map_renderer
 from smart_workflow import (
     HealthAwareWorkflowRunner,
     MonitoringClient,
@@ -114,6 +115,7 @@ def run_daemon(config: AppConfig, context: TaskContext | None = None) -> None:
     try:
         runner.run()
     finally:
+        close_global_map_renderer(context)
         close_messaging_client(context)
         stop_health_server(health_server)
 
@@ -44,6 +44,8 @@ class GlobalMapRenderConfig(BaseModel):
 
     mode: str = Field(default="write", description="輸出模式：write/show/both")
     output_dir: str = Field(default="output/global_map", description="輸出資料夾")
+    snapshot_format: str = Field(default="jpg", description="快照格式：jpg/png/webp")
+    snapshot_quality: int = Field(default=85, ge=1, le=100, description="jpg/webp 快照品質")
     window_name: str = Field(default="global-map", description="顯示視窗名稱")
     marker_radius: int = Field(default=6, ge=1, description="標記半徑底值")
     label_font_scale: float = Field(default=0.5, gt=0.0, description="標籤字型縮放")
@@ -53,6 +55,9 @@ class GlobalMapRenderConfig(BaseModel):
     show_legend: bool = Field(default=True, description="是否顯示圖例")
     global_radius_ratio: float = Field(default=0.008, ge=0.0, description="global 標記半徑比例")
     local_radius_ratio: float = Field(default=0.004, ge=0.0, description="local 標記半徑比例")
+    skip_empty_frames: bool = Field(default=False, description="連續沒有物件時沿用上一張空白畫面，不重複繪製與輸出")
+    use_opencl: bool = Field(default=False, description="是否以 OpenCL（cv2.UMat）繪製標記，不支援時自動退回 CPU")
+    async_snapshots: bool = Field(default=False, description="是否改由背景執行緒輸出快照；開啟後回傳的 image_path 可能尚未寫入完成")
 
     @field_validator("mode")
     @classmethod
@@ -62,6 +67,16 @@ class GlobalMapRenderConfig(BaseModel):
             raise ValueError("mode 必須是 write、show 或 both")
         return mode
 
+    @field_validator("snapshot_format")
+    @classmethod
+    def validate_snapshot_format(cls, value: str) -> str:
+        snapshot_format = value.strip().lower().lstrip(".")
+        if snapshot_format == "jpeg":
+            snapshot_format = "jpg"
+        if snapshot_format not in {"jpg", "png", "webp"}:
+            raise ValueError("snapshot_format 必須是 jpg、png 或 webp")
+        return snapshot_format
+
     @field_validator("output_dir", "window_name")
     @classmethod
     def validate_text_fields(cls, value: str) -> str:
@@ -1,7 +1,6 @@
 """Phase change hooks."""
 from __future__ import annotations
 
-import inspect
 import logging
 from abc import ABC, abstractmethod
 from importlib import import_module
@@ -30,7 +29,18 @@ class DefaultPhaseChangeEngine(BasePhaseChangeEngine):
         context.logger.info("phase changed: %s -> %s", old_phase, new_phase)
 
 
+# 內建 engine 直接查表，不必每次 import + 反射檢查
+_BUILTIN_PHASE_CHANGE_ENGINES: dict[str, Type[BasePhaseChangeEngine]] = {
+    "default": DefaultPhaseChangeEngine,
+    f"{__name__}:DefaultPhaseChangeEngine": DefaultPhaseChangeEngine,
+    f"{__name__}.DefaultPhaseChangeEngine": DefaultPhaseChangeEngine,
+}
+
+
 def load_phase_change_engine(path: str) -> Type[BasePhaseChangeEngine]:
+    builtin = _BUILTIN_PHASE_CHANGE_ENGINES.get(path)
+    if builtin is not None:
+        return builtin
     if ":" in path:
         module_name, class_name = path.split(":", 1)
     elif "." in path:
@@ -40,7 +50,7 @@ def load_phase_change_engine(path: str) -> Type[BasePhaseChangeEngine]:
 
     module = import_module(module_name)
     attr = getattr(module, class_name, None)
-    if attr is None or not inspect.isclass(attr):
+    if not isinstance(attr, type):
         raise TaskError(f"在模組 {module_name} 找不到 PhaseChange Engine {class_name}")
     if not issubclass(attr, BasePhaseChangeEngine):
         raise TaskError(f"{class_name} 必須繼承 BasePhaseChangeEngine")
@@ -1,10 +1,10 @@
 """Phase engine interface and default implementations."""
 from __future__ import annotations
 
-import inspect
 import os
 from datetime import datetime
 from abc import ABC, abstractmethod
+from functools import lru_cache
 from importlib import import_module
 from typing import Type
 
@@ -13,6 +13,17 @@ from smart_workflow import TaskContext, TaskError
 from integration.pipeline.control.scheduler import Phase
 
 
+@lru_cache(maxsize=1)
+def _debounce_settings() -> tuple[int, int, str, str]:
+    """Parse DebouncedPhaseEngine env settings; call ``cache_clear()`` after changing them."""
+    return (
+        int(os.getenv("PHASE_STABLE_SECONDS", "180")),
+        int(os.getenv("EDGE_EVENT_STALE_SECONDS", "0")),
+        os.getenv("EDGE_EVENT_STALE_MODE", "freeze").strip().lower(),
+        os.getenv("EDGE_EVENT_UNKNOWN_PHASE", "unknown").strip() or "unknown",
+    )
+
+
 class BasePhaseEngine(ABC):
     """Resolve the current phase for the integration pipeline."""
 
@@ -41,20 +52,23 @@ class DebouncedPhaseEngine(BasePhaseEngine):
         self._stable_phase: Phase | None = None
         self._pending_phase: Phase | None = None
         self._pending_since: datetime | None = None
-        # phase 需穩定的秒數，超過才允許切換
-        self._stable_seconds = int(os.getenv("PHASE_STABLE_SECONDS", "180"))
-        # 事件過久未更新的判定秒數與策略
-        self._stale_seconds = int(os.getenv("EDGE_EVENT_STALE_SECONDS", "0"))
-        self._stale_mode = os.getenv("EDGE_EVENT_STALE_MODE", "freeze").strip().lower()
-        self._unknown_phase = os.getenv("EDGE_EVENT_UNKNOWN_PHASE", "unknown").strip() or "unknown"
+        # phase 需穩定的秒數、事件過久未更新的判定秒數與策略（環境變數只解析一次）
+        (
+            self._stable_seconds,
+            self._stale_seconds,
+            self._stale_mode,
+            self._unknown_phase,
+        ) = _debounce_settings()
 
     def resolve(self, context: TaskContext) -> Phase:
+        # 最新事件時間與當下時間每次 resolve 只取一次
+        latest_event = self._latest_event_time(context)
+        now = self._now(latest_event.tzinfo if latest_event is not None else None)
         # 1) 先用 scheduler 取得候選 phase（可能立即變動）
         scheduler = context.require_resource("scheduler")
-        candidate = scheduler.current_phase(self._latest_event_time(context))
+        candidate = scheduler.current_phase(latest_event)
         # 2) 檢查資料是否 stale：可選擇 freeze 或回報 unknown
-        latest_event = self._latest_event_time(context)
-        if self._is_stale(latest_event):
+        if self._is_stale(latest_event, now):
             if self._stale_mode == "unknown":
                 return Phase(name=self._unknown_phase, is_working_hours=False)
             if self._stable_phase is not None:
@@ -74,15 +88,15 @@ class DebouncedPhaseEngine(BasePhaseEngine):
         if self._pending_phase is None or candidate.name != self._pending_phase.name:
             # 新的候選與 pending 不同，開始等待穩定時間
             self._pending_phase = candidate
-            self._pending_since = self._latest_event_time(context) or self._now()
+            self._pending_since = latest_event or now
             return self._stable_phase
 
         if self._pending_since is None:
             # pending 存在但無起始時間，補上時間點
-            self._pending_since = self._latest_event_time(context) or self._now()
+            self._pending_since = latest_event or now
             return self._stable_phase
 
-        if self._seconds_since(self._pending_since) >= self._stable_seconds:
+        if self._seconds_since(self._pending_since, now) >= self._stable_seconds:
             # 候選維持足夠時間，正式切換為穩定 phase
             self._stable_phase = candidate
             self._pending_phase = None
@@ -90,26 +104,46 @@ class DebouncedPhaseEngine(BasePhaseEngine):
         return self._stable_phase
 
     def _latest_event_time(self, context: TaskContext) -> datetime | None:
-        # 取最新事件時間（用於 stale 判斷與防抖）
-        events = context.get_resource("edge_events_latest") or []
-        timestamps = [event.get("timestamp") for event in events if event.get("timestamp")]
-        if not timestamps:
-            return None
-        return max(timestamps)
-
-    def _seconds_since(self, since: datetime) -> float:
-        return (self._now(since.tzinfo) - since).total_seconds()
+        # 取最新事件時間（用於 stale 判斷與防抖）；優先使用 ingestion 預先算好的值
+        latest: datetime | None = context.get_resource("edge_events_max_ts")
+        if latest is not None:
+            return latest
+        for event in context.get_resource("edge_events_latest") or []:
+            timestamp = event.get("timestamp")
+            if timestamp and (latest is None or timestamp > latest):
+                latest = timestamp
+        return latest
+
+    def _seconds_since(self, since: datetime, now: datetime | None = None) -> float:
+        if now is None or (now.tzinfo is None) != (since.tzinfo is None):
+            # naive/aware 不一致時改用 since 的時區重新取時間
+            now = self._now(since.tzinfo)
+        return (now - since).total_seconds()
 
     def _now(self, tzinfo=None) -> datetime:
         return datetime.now(tz=tzinfo)
 
-    def _is_stale(self, latest_event: datetime | None) -> bool:
+    def _is_stale(self, latest_event: datetime | None, now: datetime | None = None) -> bool:
         if self._stale_seconds <= 0 or latest_event is None:
             return False
-        return (self._now(latest_event.tzinfo) - latest_event).total_seconds() >= self._stale_seconds
+        return self._seconds_since(latest_event, now) >= self._stale_seconds
+
+
+# 內建 engine 直接查表，不必每次 import + 反射檢查
+_BUILTIN_PHASE_ENGINES: dict[str, Type[BasePhaseEngine]] = {
+    "time_based": TimeBasedPhaseEngine,
+    "debounced": DebouncedPhaseEngine,
+    f"{__name__}:TimeBasedPhaseEngine": TimeBasedPhaseEngine,
+    f"{__name__}.TimeBasedPhaseEngine": TimeBasedPhaseEngine,
+    f"{__name__}:DebouncedPhaseEngine": DebouncedPhaseEngine,
+    f"{__name__}.DebouncedPhaseEngine": DebouncedPhaseEngine,
+}
 
 
 def load_phase_engine(path: str) -> Type[BasePhaseEngine]:
+    builtin = _BUILTIN_PHASE_ENGINES.get(path)
+    if builtin is not None:
+        return builtin
     if ":" in path:
         module_name, class_name = path.split(":", 1)
     elif "." in path:
@@ -119,7 +153,7 @@ def load_phase_engine(path: str) -> Type[BasePhaseEngine]:
 
     module = import_module(module_name)
     attr = getattr(module, class_name, None)
-    if attr is None or not inspect.isclass(attr):
+    if not isinstance(attr, type):
         raise TaskError(f"在模組 {module_name} 找不到 Phase Engine {class_name}")
     if not issubclass(attr, BasePhaseEngine):
         raise TaskError(f"{class_name} 必須繼承 BasePhaseEngine")
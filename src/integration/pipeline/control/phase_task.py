@@ -3,6 +3,7 @@ from __future__ import annotations
 
 import logging
 import time
+from typing import Callable, TypeVar
 
 from integration.pipeline.control.phase_engine import BasePhaseEngine, TimeBasedPhaseEngine, load_phase_engine
 from integration.pipeline.control.phase_change import (
@@ -13,16 +14,34 @@ from integration.pipeline.control.phase_change import (
 from integration.pipeline.control.scheduler import PipelineScheduler
 from smart_workflow import BaseTask, TaskContext, TaskResult, TaskError
 
+T = TypeVar("T")
+
 
 class PhaseTask(BaseTask):
     name = "phase_controller"
+    _EPHEMERAL_CONTEXT_KEYS: tuple[str, ...] = (
+        "edge_events",
+        "pipeline_has_new_data",
+        "pipeline_dirty_camera_ids",
+        "mc_mot_tracked",
+        "mc_mot_global_objects",
+        "global_map_snapshot",
+        "rules_payload",
+        "rule_events",
+        "warehouse_modeling_task_list",
+        "warehouse_modeling_status",
+        "warehouse_modeling_should_create",
+        "warehouse_modeling_mock_published",
+    )
 
     def __init__(self, context: TaskContext | None = None) -> None:
         self._engine: BasePhaseEngine | None = None
         self._phase_change_engine: BasePhaseChangeEngine | None = None
         self._last_phase: str | None = None
         self._last_publish_time: float = 0.0
-        self._last_run_time_by_phase: dict[str, float] = {}
+        self._last_run_time_by_phase: dict[str, int] = {}
+        self._publish_settings_for: object | None = None
+        self._publish_settings: tuple[bool, str, int] | None = None
 
     def execute(self, context: TaskContext) -> TaskResult:
         """Run the phase controller without the default task-start INFO log."""
@@ -40,6 +59,9 @@ class PhaseTask(BaseTask):
         return result
 
     def run(self, context: TaskContext) -> TaskResult:
+        # 間隔計算統一使用單次讀取的 monotonic 時間，避免受系統校時影響
+        now_ns = time.monotonic_ns()
+        now = now_ns / 1_000_000_000
         state = self._load_state(context)
         last_phase = state["last_phase"]
         last_publish_time = state["last_publish_time"]
@@ -63,45 +85,36 @@ class PhaseTask(BaseTask):
             
         # 3) 回報 heartbeat、必要時推播 phase 變更
         context.monitor.heartbeat(phase=phase.name)
-        publish_cfg = getattr(context.config, "phase_messaging", None)
-        broadcast_enabled = getattr(publish_cfg, "enabled", True) if publish_cfg else True
-        publish_backend = (getattr(publish_cfg, "backend", None) or "mqtt").strip().lower()
-        heartbeat_seconds = getattr(publish_cfg, "heartbeat_seconds", 0) if publish_cfg else 0
+        broadcast_enabled, publish_backend, heartbeat_seconds = self._resolve_publish_settings(context)
         changed, heartbeat_due = self._phase_change_flags(
             phase.name,
             heartbeat_seconds,
             last_phase,
             last_publish_time,
+            now,
         )
         log_level = logging.INFO if changed or heartbeat_due else logging.DEBUG
-        context.logger.log(
-            log_level,
-            "phase task: phase=%s changed=%s heartbeat_due=%s broadcast_enabled=%s",
-            phase.name,
-            changed,
-            heartbeat_due,
-            broadcast_enabled,
-        )
+        if context.logger.isEnabledFor(log_level):
+            context.logger.log(
+                log_level,
+                "phase task: phase=%s changed=%s heartbeat_due=%s broadcast_enabled=%s",
+                phase.name,
+                changed,
+                heartbeat_due,
+                broadcast_enabled,
+            )
         self._maybe_notify_phase_change(context, phase.name, changed, last_phase)
-        self._maybe_publish_phase(
-            context,
-            phase.name,
-            changed,
-            heartbeat_due,
-            broadcast_enabled,
-            publish_backend,
-            state,
-        )
+        if broadcast_enabled and (changed or heartbeat_due):
+            self._maybe_publish_phase(context, phase.name, publish_backend, state, now)
         state["last_phase"] = phase.name
 
         try:
             # 4) 根據 phase 的 interval_seconds 進行節流判斷
             phase_policies = context.get_resource("pipeline_policies") or {}
             policy = phase_policies.get(phase.name)
-            if policy is not None and policy.enabled:
-                now = time.time()
-                last_run = last_run_time_by_phase.get(phase.name, 0.0)
-                if (now - last_run) < policy.interval:
+            if policy is not None:
+                last_run_ns = last_run_time_by_phase.get(phase.name)
+                if last_run_ns is not None and not policy.should_run_ns(last_run_ns, now_ns):
                     return TaskResult(status="phase_skipped", payload={"phase": phase.name})
 
             # 5) 依 phase 取得對應 pipeline 並執行
@@ -109,45 +122,66 @@ class PhaseTask(BaseTask):
             pipeline = pipeline_registry.get(phase.name)
             if pipeline:
                 pipeline.execute(context)
-                last_run_time_by_phase[phase.name] = time.time()
+                last_run_time_by_phase[phase.name] = time.monotonic_ns()
                 return TaskResult(status="phase_pipeline", payload={"phase": phase.name})
             raise TaskError(f"phase {phase.name} 未設定對應 pipeline")
         finally:
             self._cleanup_context(context)
 
     def _init_engine(self, context: TaskContext | None) -> BasePhaseEngine:
-        cfg = getattr(context.config, "phase_task", None) if context else None
-        engine_path = getattr(cfg, "engine_class", None) if cfg else None
-        if not engine_path:
-            return TimeBasedPhaseEngine(context=context)
-        try:
-            engine_cls = load_phase_engine(engine_path)
-        except Exception as exc:  # pylint: disable=broad-except
-            raise TaskError(f"無法載入 Phase Engine：{engine_path}") from exc
-        try:
-            return engine_cls(context=context)
-        except TypeError:
-            try:
-                return engine_cls()
-            except TypeError as exc:  # pragma: no cover
-                raise TaskError(f"Phase Engine {engine_path} 無法初始化") from exc
+        return self._load_engine_with_context(
+            context,
+            "phase_task",
+            load_phase_engine,
+            TimeBasedPhaseEngine,
+            "Phase Engine",
+        )
 
     def _init_phase_change_engine(self, context: TaskContext | None) -> BasePhaseChangeEngine:
-        cfg = getattr(context.config, "phase_change", None) if context else None
+        return self._load_engine_with_context(
+            context,
+            "phase_change",
+            load_phase_change_engine,
+            DefaultPhaseChangeEngine,
+            "PhaseChange Engine",
+        )
+
+    @staticmethod
+    def _load_engine_with_context(
+        context: TaskContext | None,
+        config_key: str,
+        loader: Callable[[str], type[T]],
+        default_cls: type[T],
+        label: str,
+    ) -> T:
+        cfg = getattr(context.config, config_key, None) if context else None
         engine_path = getattr(cfg, "engine_class", None) if cfg else None
         if not engine_path:
-            return DefaultPhaseChangeEngine(context=context)
+            return default_cls(context=context)
         try:
-            engine_cls = load_phase_change_engine(engine_path)
+            engine_cls = loader(engine_path)
         except Exception as exc:  # pylint: disable=broad-except
-            raise TaskError(f"無法載入 PhaseChange Engine：{engine_path}") from exc
+            raise TaskError(f"無法載入 {label}：{engine_path}") from exc
         try:
             return engine_cls(context=context)
         except TypeError:
             try:
                 return engine_cls()
             except TypeError as exc:  # pragma: no cover
-                raise TaskError(f"PhaseChange Engine {engine_path} 無法初始化") from exc
+                raise TaskError(f"{label} {engine_path} 無法初始化") from exc
+
+    def _resolve_publish_settings(self, context: TaskContext) -> tuple[bool, str, int]:
+        # 設定於執行期間不變，依 config 物件快取解析結果（以 is 比對，避免 id 被回收後重用）
+        settings = self._publish_settings
+        if settings is None or self._publish_settings_for is not context.config:
+            publish_cfg = getattr(context.config, "phase_messaging", None)
+            broadcast_enabled = getattr(publish_cfg, "enabled", True) if publish_cfg else True
+            publish_backend = (getattr(publish_cfg, "backend", None) or "mqtt").strip().lower()
+            heartbeat_seconds = getattr(publish_cfg, "heartbeat_seconds", 0) if publish_cfg else 0
+            settings = (broadcast_enabled, publish_backend, heartbeat_seconds)
+            self._publish_settings_for = context.config
+            self._publish_settings = settings
+        return settings
 
     def _phase_change_flags(
         self,
@@ -155,11 +189,11 @@ class PhaseTask(BaseTask):
         heartbeat_seconds: int,
         last_phase: str | None,
         last_publish_time: float,
+        now: float,
     ) -> tuple[bool, bool]:
         changed = phase_name != last_phase
         heartbeat_due = False
         if not changed and heartbeat_seconds > 0 and last_publish_time > 0:
-            now = time.time()
             heartbeat_due = (now - last_publish_time) >= heartbeat_seconds
         return changed, heartbeat_due
 
@@ -183,19 +217,10 @@ class PhaseTask(BaseTask):
         self,
         context: TaskContext,
         phase_name: str,
-        changed: bool,
-        heartbeat_due: bool,
-        broadcast_enabled: bool,
         publish_backend: str,
         state: dict[str, object],
+        now: float,
     ) -> None:
-        if not broadcast_enabled:
-            return
-
-        if not changed and not heartbeat_due:
-            return
-
-        now = time.time()
         state["last_publish_time"] = now
         messaging = context.get_resource("messaging_client")
         if messaging is None:
@@ -205,7 +230,7 @@ class PhaseTask(BaseTask):
         try:
             published = messaging.publish(
                 "phase_publish",
-                {"phase": phase_name, "timestamp": now},
+                {"phase": phase_name, "timestamp": time.time()},
             )
         except Exception as exc:  # pylint: disable=broad-except
             context.logger.warning("phase publish skipped (backend=%s): %s", publish_backend, exc)
@@ -233,19 +258,6 @@ class PhaseTask(BaseTask):
         for key in self._ephemeral_context_keys():
             context.set_resource(key, None)
 
-    @staticmethod
-    def _ephemeral_context_keys() -> tuple[str, ...]:
-        return (
-            "edge_events",
-            "pipeline_has_new_data",
-            "pipeline_dirty_camera_ids",
-            "mc_mot_tracked",
-            "mc_mot_global_objects",
-            "global_map_snapshot",
-            "rules_payload",
-            "rule_events",
-            "warehouse_modeling_task_list",
-            "warehouse_modeling_status",
-            "warehouse_modeling_should_create",
-            "warehouse_modeling_mock_published",
-        )
+    @classmethod
+    def _ephemeral_context_keys(cls) -> tuple[str, ...]:
+        return cls._EPHEMERAL_CONTEXT_KEYS
@@ -1,11 +1,12 @@
 """Scheduling utilities that determine pipeline phases."""
 from __future__ import annotations
 
-import inspect
 from abc import ABC, abstractmethod
+from bisect import bisect_right
 from dataclasses import dataclass
-from datetime import datetime, timezone
+from datetime import datetime, time, timezone
 from importlib import import_module
+from time import monotonic
 from typing import Iterable, Type
 
 from smart_workflow import TaskError
@@ -13,7 +14,7 @@ from smart_workflow import TaskError
 from integration.config.settings import ScheduleWindow
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Phase:
     name: str
     is_working_hours: bool
@@ -49,10 +50,11 @@ class SinglePhaseSchedulerEngine(BaseSchedulerEngine):
     ) -> None:
         super().__init__(windows, tz, context=context)
         self._phase_name = phase_name
+        self._phase = Phase(name=phase_name, is_working_hours=True)
 
     def resolve_phase(self, now: datetime | None = None) -> Phase:
         _ = now
-        return Phase(name=self._phase_name, is_working_hours=True)
+        return self._phase
 
 
 class TimeWindowSchedulerEngine(BaseSchedulerEngine):
@@ -60,14 +62,59 @@ class TimeWindowSchedulerEngine(BaseSchedulerEngine):
 
     def __init__(self, windows: Iterable[ScheduleWindow], tz: timezone, context=None) -> None:
         super().__init__(windows, tz, context=context)
+        self._starts, self._ends = self._merge_windows(self._windows)
+        self._working = Phase(name="working", is_working_hours=True)
+        self._non_working = Phase(name="non_working", is_working_hours=False)
+        self._cached_phase = self._non_working
+        self._cached_until = float("-inf")
 
     def resolve_phase(self, now: datetime | None = None) -> Phase:
-        now = now or datetime.now(tz=self._tz)
-        current_time = now.timetz().replace(tzinfo=None)
-        for window in self._windows:
-            if window.contains(current_time):
-                return Phase(name="working", is_working_hours=True)
-        return Phase(name="non_working", is_working_hours=False)
+        if now is not None:
+            return self._lookup(now)[0]
+        # 未指定時間時沿用結果至下一個時段邊界；夏令時間或系統校時會使推算失準，故設上限
+        tick = monotonic()
+        if tick < self._cached_until:
+            return self._cached_phase
+        phase, remaining_us = self._lookup(datetime.now(tz=self._tz))
+        self._cached_phase = phase
+        self._cached_until = tick + min(remaining_us / 1_000_000, _PHASE_CACHE_MAX_SECONDS)
+        return phase
+
+    def _lookup(self, now: datetime) -> tuple[Phase, int]:
+        """Return the phase at ``now`` and microseconds until it may change."""
+        current = _time_of_day_us(now.time())
+        idx = bisect_right(self._starts, current) - 1
+        if idx >= 0 and current < self._ends[idx]:
+            return self._working, self._ends[idx] - current
+        if idx + 1 < len(self._starts):
+            return self._non_working, self._starts[idx + 1] - current
+        return self._non_working, _DAY_US - current
+
+    @staticmethod
+    def _merge_windows(windows: Iterable[ScheduleWindow]) -> tuple[list[int], list[int]]:
+        # 將時段轉為當日微秒並合併重疊區間，查詢時可用二分搜尋
+        spans = sorted(
+            (_time_of_day_us(window.start), _time_of_day_us(window.end))
+            for window in windows
+            if window.start < window.end
+        )
+        starts: list[int] = []
+        ends: list[int] = []
+        for start, end in spans:
+            if ends and start <= ends[-1]:
+                ends[-1] = max(ends[-1], end)
+                continue
+            starts.append(start)
+            ends.append(end)
+        return starts, ends
+
+
+_DAY_US = 24 * 60 * 60 * 1_000_000
+_PHASE_CACHE_MAX_SECONDS = 60.0
+
+
+def _time_of_day_us(value: time) -> int:
+    return ((value.hour * 60 + value.minute) * 60 + value.second) * 1_000_000 + value.microsecond
 
 
 def load_scheduler_engine(path: str) -> Type[BaseSchedulerEngine]:
@@ -79,7 +126,7 @@ def load_scheduler_engine(path: str) -> Type[BaseSchedulerEngine]:
         raise TaskError(f"無法解析 Scheduler Engine 路徑：{path}")
     module = import_module(module_name)
     attr = getattr(module, class_name, None)
-    if attr is None or not inspect.isclass(attr):
+    if not isinstance(attr, type):
         raise TaskError(f"在模組 {module_name} 找不到 Scheduler Engine {class_name}")
     if not issubclass(attr, BaseSchedulerEngine):
         raise TaskError(f"{class_name} 必須繼承 BaseSchedulerEngine")
@@ -7,6 +7,19 @@ from smart_workflow import BaseTask, TaskContext, TaskResult, TaskError
 
 from integration.pipeline.schedule import load_pipeline_schedule, load_task_class
 
+_ENABLED_VALUES = frozenset({"1", "true", "yes"})
+_DISABLED_VALUES = frozenset({"0", "false", "no", "off"})
+
+
+def _is_enabled(env_name: str) -> bool:
+    value = os.environ.get(env_name)
+    return value is not None and value.strip().lower() in _ENABLED_VALUES
+
+
+def _is_disabled(env_name: str) -> bool:
+    value = os.environ.get(env_name)
+    return value is not None and value.strip().lower() in _DISABLED_VALUES
+
 
 class InitPipelineTask(BaseTask):
     """Bootstrap working pipeline(s) and store them in TaskContext."""
@@ -16,7 +29,7 @@ class InitPipelineTask(BaseTask):
     def run(self, context: TaskContext) -> TaskResult:
         pipeline_registry = self._build_pipeline_registry(context)
         context.set_resource("pipeline_registry", pipeline_registry)
-        if os.getenv("CONFIG_SUMMARY", "").strip().lower() in {"1", "true", "yes"}:
+        if _is_enabled("CONFIG_SUMMARY"):
             context.logger.info(self._format_pipeline_summary(pipeline_registry, context))
         return TaskResult(status="pipeline_initialised", payload={"pipelines": list(pipeline_registry.keys())})
 
@@ -25,9 +38,13 @@ class InitPipelineTask(BaseTask):
         if not schedule_path:
             raise TaskError("PIPELINE_SCHEDULE_PATH 未設定")
         pipelines, phases, phase_policies = load_pipeline_schedule(schedule_path)
+        # 只建立有被 phase 引用的 pipeline，未使用的不需載入
+        referenced = set(phases.values())
         pipeline_instances: dict[str, BaseTask] = {}
         for name, spec in pipelines.items():
-            if spec.enabled_env and os.getenv(spec.enabled_env, "").strip().lower() in {"0", "false", "no", "off"}:
+            if name not in referenced:
+                continue
+            if spec.enabled_env and _is_disabled(spec.enabled_env):
                 continue
             pipeline_cls = load_task_class(spec.class_path)
             kwargs = dict(spec.kwargs)
@@ -40,20 +57,26 @@ class InitPipelineTask(BaseTask):
                 pipeline = pipeline_cls(**kwargs)
             pipeline_instances[name] = pipeline
 
-        registry: dict[str, BaseTask] = {}
-        for phase_name, pipeline_name in phases.items():
-            pipeline = pipeline_instances.get(pipeline_name)
-            if not pipeline:
-                raise TaskError(f"phase {phase_name} 找不到 pipeline: {pipeline_name}")
-            registry[phase_name] = pipeline
+        missing = [
+            f"phase {phase_name} 找不到 pipeline: {pipeline_name}"
+            for phase_name, pipeline_name in phases.items()
+            if pipeline_name not in pipeline_instances
+        ]
+        if missing:
+            raise TaskError("；".join(missing))
+        registry = {phase_name: pipeline_instances[pipeline_name] for phase_name, pipeline_name in phases.items()}
         context.set_resource("pipeline_policies", phase_policies)
         return registry
 
     def _format_pipeline_summary(self, registry: dict[str, BaseTask], context: TaskContext) -> str:
         lines = ["pipeline registry summary:"]
+        # 多個 phase 可能共用同一 pipeline，同一次摘要內只描述一次
+        described: dict[int, str] = {}
         for phase, pipeline in registry.items():
             pipeline_name = pipeline.__class__.__name__
-            nodes = self._describe_nodes(pipeline, context)
+            nodes = described.get(id(pipeline))
+            if nodes is None:
+                nodes = described[id(pipeline)] = self._describe_nodes(pipeline, context)
             lines.append(f"- phase={phase} pipeline={pipeline_name}")
             if nodes:
                 lines.append(f"  flow: {nodes}")
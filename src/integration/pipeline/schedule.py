@@ -1,29 +1,35 @@
 """Pipeline schedule loader for phase-based pipelines."""
 from __future__ import annotations
 
-import inspect
 import json
-from dataclasses import dataclass
+import sys
+from dataclasses import dataclass, field
 from importlib import import_module
 from pathlib import Path
-from typing import Any, Dict, Tuple, Type
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Tuple, Type
 
 from smart_workflow import BaseTask, TaskError
 
 from integration.utils.paths import get_config_root
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PipelineSpec:
     name: str
     class_path: str
-    kwargs: Dict[str, Any]
+    kwargs: Mapping[str, Any]
     enabled_env: str | None = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PhasePolicy:
     interval_seconds: float | None = None
+    _interval_ns: int = field(init=False, repr=False, compare=False, default=0)
+
+    def __post_init__(self) -> None:
+        interval_ns = int(self.interval_seconds * 1_000_000_000) if self.enabled else 0
+        object.__setattr__(self, "_interval_ns", interval_ns)
 
     @property
     def enabled(self) -> bool:
@@ -38,6 +44,17 @@ class PhasePolicy:
             return True
         return (now - last_run_time) >= self.interval
 
+    def should_run_ns(self, last_run_ns: int, now_ns: int) -> bool:
+        """Integer variant of :meth:`should_run` for ``time.monotonic_ns`` stamps."""
+        return (now_ns - last_run_ns) >= self._interval_ns
+
+
+_TASK_CLASS_CACHE: Dict[str, Type[BaseTask]] = {}
+_SCHEDULE_CACHE: Dict[
+    Tuple[str, int, int],
+    Tuple[Dict[str, PipelineSpec], Dict[str, str], Dict[str, PhasePolicy]],
+] = {}
+
 
 def resolve_schedule_path(raw_path: str | Path) -> Path:
     """Resolve a schedule path relative to the config root."""
@@ -51,11 +68,27 @@ def load_pipeline_schedule(
     path: str | Path,
 ) -> Tuple[Dict[str, PipelineSpec], Dict[str, str], Dict[str, PhasePolicy]]:
     schedule_path = resolve_schedule_path(path)
-    if not schedule_path.exists():
-        raise TaskError(f"找不到 pipeline schedule：{schedule_path}")
     try:
-        data = json.loads(schedule_path.read_text())
-    except json.JSONDecodeError as exc:
+        stat = schedule_path.stat()
+    except FileNotFoundError as exc:
+        raise TaskError(f"找不到 pipeline schedule：{schedule_path}") from exc
+    # 檔案未變動時沿用上次解析結果
+    cache_key = (str(schedule_path), stat.st_mtime_ns, stat.st_size)
+    cached = _SCHEDULE_CACHE.get(cache_key)
+    if cached is None:
+        cached = _parse_pipeline_schedule(schedule_path.read_bytes())
+        _SCHEDULE_CACHE.clear()
+        _SCHEDULE_CACHE[cache_key] = cached
+    pipelines, phases, phase_policies = cached
+    return dict(pipelines), dict(phases), dict(phase_policies)
+
+
+def _parse_pipeline_schedule(
+    raw: bytes,
+) -> Tuple[Dict[str, PipelineSpec], Dict[str, str], Dict[str, PhasePolicy]]:
+    try:
+        data = json.loads(raw)
+    except (json.JSONDecodeError, UnicodeDecodeError) as exc:
         raise TaskError(f"pipeline schedule 格式錯誤：{exc}") from exc
 
     if not isinstance(data, dict):
@@ -101,6 +134,9 @@ def load_pipeline_schedule(
 
 
 def load_task_class(path: str) -> Type[BaseTask]:
+    cached = _TASK_CLASS_CACHE.get(path)
+    if cached is not None:
+        return cached
     if ":" in path:
         module_name, class_name = path.split(":", 1)
     elif "." in path:
@@ -109,13 +145,19 @@ def load_task_class(path: str) -> Type[BaseTask]:
         raise TaskError(f"無法解析 Task 路徑：{path}")
     module = import_module(module_name)
     attr = getattr(module, class_name, None)
-    if attr is None or not inspect.isclass(attr):
+    if not isinstance(attr, type):
         raise TaskError(f"在模組 {module_name} 找不到 Task {class_name}")
     if not issubclass(attr, BaseTask):
         raise TaskError(f"{class_name} 必須繼承 BaseTask")
+    _TASK_CLASS_CACHE[path] = attr
     return attr
 
 
+def clear_task_class_cache() -> None:
+    """Forget classes resolved by :func:`load_task_class`."""
+    _TASK_CLASS_CACHE.clear()
+
+
 def _build_pipeline_spec(name: str, cfg: Dict[str, Any]) -> PipelineSpec:
     if not isinstance(cfg, dict):
         raise TaskError(f"pipeline {name} 設定必須是物件")
@@ -128,4 +170,10 @@ def _build_pipeline_spec(name: str, cfg: Dict[str, Any]) -> PipelineSpec:
     if not isinstance(kwargs, dict):
         raise TaskError(f"pipeline {name} kwargs 必須是物件")
     enabled_env = cfg.get("enabled_env")
-    return PipelineSpec(name=name, class_path=str(class_path), kwargs=kwargs, enabled_env=enabled_env)
+    # 解析結果會被快取共用，kwargs 以唯讀檢視保存
+    return PipelineSpec(
+        name=name,
+        class_path=sys.intern(str(class_path)),
+        kwargs=MappingProxyType(dict(kwargs)),
+        enabled_env=enabled_env,
+    )
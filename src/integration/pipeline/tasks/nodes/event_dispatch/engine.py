@@ -1,6 +1,7 @@
 """Event dispatch engine interface."""
 from __future__ import annotations
 
+import logging
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from typing import Any, Dict, List, Type
@@ -10,7 +11,7 @@ from smart_workflow import TaskContext
 from integration.pipeline.tasks.plugin_loader import load_plugin_class
 
 
-@dataclass
+@dataclass(slots=True)
 class EventDispatchResult:
     dispatched: int = 0
     skipped: int = 0
@@ -34,14 +35,13 @@ class DefaultEventDispatchEngine(BaseEventDispatchEngine):
 
     def dispatch(self, events: List[Dict[str, Any]], context: TaskContext) -> EventDispatchResult:
         count = len(events)
-        for event in events:
-            context.logger.debug(
-                "event dispatch: id=%s name=%s timestamp=%s event_type=%s",
-                event.get("id"),
-                event.get("name"),
-                event.get("timestamp"),
-                event.get("event_type"),
+        if count and context.logger.isEnabledFor(logging.DEBUG):
+            lines = "\n".join(
+                f"  id={event.get('id')} name={event.get('name')} "
+                f"timestamp={event.get('timestamp')} event_type={event.get('event_type')}"
+                for event in events
             )
+            context.logger.debug("event dispatch batch (%d):\n%s", count, lines)
         return EventDispatchResult(dispatched=count, skipped=0, failed=0)
 
 
@@ -14,6 +14,10 @@ from .engine import (
 )
 
 
+_REQUIRED_EVENT_FIELDS = ("id", "name", "timestamp", "event_type")
+_REQUIRED_EVENT_KEYS = frozenset(_REQUIRED_EVENT_FIELDS)
+
+
 class EventDispatchTask(QuietTaskBase):
     name = "event_dispatch"
 
@@ -30,9 +34,9 @@ class EventDispatchTask(QuietTaskBase):
         for event in events:
             if not isinstance(event, dict):
                 raise TaskError("rule_events 必須是 dict list")
-            for key in ("id", "name", "timestamp", "event_type"):
-                if key not in event:
-                    raise TaskError(f"event missing field: {key}")
+            if not event.keys() >= _REQUIRED_EVENT_KEYS:
+                missing = next(key for key in _REQUIRED_EVENT_FIELDS if key not in event)
+                raise TaskError(f"event missing field: {missing}")
 
         result = self._engine.dispatch(events, context)
         store_stage_stats(
@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from collections import Counter, defaultdict
 from datetime import datetime, timezone
 from typing import Any, Dict, Iterable, Type
 
@@ -12,6 +13,11 @@ from integration.pipeline.tasks.plugin_loader import load_plugin_class
 from .expect_output import ExpectOutputTransformer
 
 
+def _as_list(items: Iterable[Dict[str, Any]]) -> list[Dict[str, Any]]:
+    # 上游多半已傳入 list，避免重複複製
+    return items if isinstance(items, list) else list(items)
+
+
 class BaseFormatEngine(ABC):
     """Interface for converting MC-MOT result into downstream payload."""
 
@@ -42,9 +48,9 @@ class LegacyFormatEngine(BaseFormatEngine):
         global_objects: Iterable[Dict[str, Any]],
         snapshot_path: str | None,
     ) -> Dict[str, Any]:
-        events_list = list(events)
-        tracked_list = list(tracked)
-        global_list = list(global_objects)
+        events_list = _as_list(events)
+        tracked_list = _as_list(tracked)
+        global_list = _as_list(global_objects)
         expect_output = self._expect_transformer.transform(tracked_list, global_list)
         payload = {
             "events": events_list,
@@ -62,25 +68,18 @@ class LegacyFormatEngine(BaseFormatEngine):
 
     @staticmethod
     def _summarize_by_camera(tracked: Iterable[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
-        summary: Dict[str, Dict[str, Any]] = {}
+        by_camera: defaultdict[str, Counter[str]] = defaultdict(Counter)
         for item in tracked:
-            camera_id = item.get("camera_id") or "unknown"
-            camera_entry = summary.setdefault(camera_id, {"total": 0, "classes": {}})
-            camera_entry["total"] += 1
-            class_name = item.get("class_name") or "unknown"
-            classes = camera_entry.setdefault("classes", {})
-            classes[class_name] = classes.get(class_name, 0) + 1
-        return summary
+            by_camera[item.get("camera_id") or "unknown"][item.get("class_name") or "unknown"] += 1
+        return {
+            camera_id: {"total": sum(classes.values()), "classes": dict(classes)}
+            for camera_id, classes in by_camera.items()
+        }
 
     @staticmethod
     def _summarize_global(global_objects: Iterable[Dict[str, Any]]) -> Dict[str, Any]:
-        total = 0
-        class_counter: Dict[str, int] = {}
-        for obj in global_objects:
-            total += 1
-            class_name = obj.get("class_name") or "unknown"
-            class_counter[class_name] = class_counter.get(class_name, 0) + 1
-        return {"total": total, "classes": class_counter}
+        class_counter = Counter(obj.get("class_name") or "unknown" for obj in global_objects)
+        return {"total": sum(class_counter.values()), "classes": dict(class_counter)}
 
 
 class DefaultFormatEngine(BaseFormatEngine):
@@ -97,9 +96,9 @@ class DefaultFormatEngine(BaseFormatEngine):
         global_objects: Iterable[Dict[str, Any]],
         snapshot_path: str | None,
     ) -> Dict[str, Any]:
-        events_list = list(events)
-        tracked_list = list(tracked)
-        global_list = list(global_objects)
+        events_list = _as_list(events)
+        tracked_list = _as_list(tracked)
+        global_list = _as_list(global_objects)
         return {
             "overall_metadata": {
                 "timestamp": datetime.now(timezone.utc).isoformat().replace("+00:00", "Z"),
@@ -129,35 +128,38 @@ class DefaultFormatEngine(BaseFormatEngine):
         from .models import DetectionObject
 
         cameras: Dict[str, Dict[str, Any]] = {}
+        from_detection = DetectionObject.from_detection
         for event in events:
             camera_id = event.get("camera_id")
             if not camera_id:
                 continue
             detections = event.get("detections") or []
-            camera_entry = cameras.setdefault(camera_id, {"object_metadata": {}})
+            camera_entry = cameras.get(camera_id)
+            if camera_entry is None:
+                camera_entry = cameras[camera_id] = {"object_metadata": {}}
+            object_metadata = camera_entry["object_metadata"]
             for idx, det in enumerate(detections):
-                class_name = det.get("class_name") or det.get("label") or "unknown"
-                local_id = det.get("track_id", det.get("local_id"))
+                get = det.get
+                class_name = get("class_name") or get("label") or "unknown"
+                local_id = get("track_id", get("local_id"))
                 if local_id is None:
                     local_id = idx
-                obj_id = f"{class_name}_{local_id}"
-                obj = DetectionObject.from_detection(det)
-                camera_entry["object_metadata"][obj_id] = obj.to_dict()
+                object_metadata[f"{class_name}_{local_id}"] = from_detection(det).to_dict()
         return cameras
 
     @staticmethod
     def _build_object_id_mapping(tracked: Iterable[Dict[str, Any]]) -> Dict[str, Dict[str, str]]:
-        mapping: Dict[str, Dict[str, str]] = {}
+        mapping: defaultdict[str, Dict[str, str]] = defaultdict(dict)
         for item in tracked:
-            global_id = item.get("global_id")
-            camera_id = item.get("camera_id")
-            local_id = item.get("local_id")
-            class_name = item.get("class_name") or "unknown"
+            get = item.get
+            global_id = get("global_id")
+            camera_id = get("camera_id")
+            local_id = get("local_id")
             if global_id is None or not camera_id or local_id is None:
                 continue
-            entry = mapping.setdefault(f"{class_name}_{global_id}", {})
-            entry[camera_id] = f"{class_name}_{local_id}"
-        return mapping
+            class_name = get("class_name") or "unknown"
+            mapping[f"{class_name}_{global_id}"][camera_id] = f"{class_name}_{local_id}"
+        return dict(mapping)
 
     @staticmethod
     def _extract_coordinates(obj: Dict[str, Any]) -> list[float]:
@@ -1,6 +1,7 @@
 """Utilities for converting MC-MOT output into expect_output_v1 schema."""
 from __future__ import annotations
 
+from collections import defaultdict
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from typing import Any, Dict, Iterable, List
@@ -38,9 +39,12 @@ class ExpectOutputTransformer:
         tracked_objects: Iterable[Dict[str, Any]],
         global_objects: Iterable[Dict[str, Any]],
     ) -> Dict[str, Any]:
-        camera_data = self._build_camera_data(tracked_objects)
-        object_mapping = self._build_object_mapping(tracked_objects)
-        global_payload = self._build_global_objects(global_objects)
+        if tracked_objects or global_objects:
+            camera_data, object_mapping = self._build_tracked_sections(tracked_objects)
+            global_payload = self._build_global_objects(global_objects)
+        else:
+            # 兩者皆為空時不需逐段組裝
+            camera_data, object_mapping, global_payload = {}, {}, {}
         return {
             "overall_metadata": {
                 "timestamp": datetime.now(self.tz).isoformat(),
@@ -50,38 +54,34 @@ class ExpectOutputTransformer:
             "object_id_mapping": object_mapping,
         }
 
-    def _build_camera_data(self, tracked_objects: Iterable[Dict[str, Any]]) -> Dict[str, Any]:
+    def _build_tracked_sections(
+        self,
+        tracked_objects: Iterable[Dict[str, Any]],
+    ) -> tuple[Dict[str, Any], Dict[str, Dict[str, str]]]:
+        """Build ``camera_data`` and ``object_id_mapping`` in one pass over tracked objects."""
         per_camera: Dict[str, Dict[str, Any]] = {}
+        mapping: defaultdict[str, Dict[str, str]] = defaultdict(dict)
+        metadata_by_camera: Dict[str, Dict[str, Any]] = {}
         for obj in tracked_objects:
-            camera_id = obj.get("camera_id") or "unknown"
-            class_name = obj.get("class_name") or "unknown"
-            local_id = obj.get("local_id")
-            bbox = obj.get("bbox")
-            score = obj.get("score")
-
-            obj_key = f"{class_name}_{local_id}"
-            camera_entry = per_camera.setdefault(camera_id, {"object_metadata": {}})
-            camera_entry["object_metadata"][obj_key] = {
+            get = obj.get
+            camera_id = get("camera_id") or "unknown"
+            class_name = get("class_name") or "unknown"
+            obj_key = f"{class_name}_{get('local_id')}"
+
+            object_metadata = metadata_by_camera.get(camera_id)
+            if object_metadata is None:
+                object_metadata = metadata_by_camera[camera_id] = {}
+                per_camera[camera_id] = {"object_metadata": object_metadata}
+            object_metadata[obj_key] = {
                 "class_name": class_name,
-                "bbox": bbox,
-                "confidence_score": _convert_value(score),
+                "bbox": get("bbox"),
+                "confidence_score": _convert_value(get("score")),
             }
-        return per_camera
 
-    def _build_object_mapping(self, tracked_objects: Iterable[Dict[str, Any]]) -> Dict[str, Dict[str, str]]:
-        mapping: Dict[str, Dict[str, str]] = {}
-        for obj in tracked_objects:
-            global_id = obj.get("global_id")
-            if not _is_valid_global_id(global_id):
-                continue
-            class_name = obj.get("class_name") or "unknown"
-            local_id = obj.get("local_id")
-            camera_id = obj.get("camera_id") or "unknown"
-            obj_key = f"{class_name}_{local_id}"
-            global_key = f"{class_name}_{global_id}"
-            camera_map = mapping.setdefault(global_key, {})
-            camera_map[camera_id] = obj_key
-        return mapping
+            global_id = get("global_id")
+            if _is_valid_global_id(global_id):
+                mapping[f"{class_name}_{global_id}"][camera_id] = obj_key
+        return per_camera, dict(mapping)
 
     def _build_global_objects(self, global_objects: Iterable[Dict[str, Any]]) -> Dict[str, Any]:
         payload: Dict[str, Any] = {}
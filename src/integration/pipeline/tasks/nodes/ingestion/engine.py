@@ -11,6 +11,30 @@ from smart_workflow import TaskContext
 from integration.pipeline.tasks.plugin_loader import load_plugin_class
 
 
+@dataclass(slots=True)
+class _NormalizedEvent:
+    """Internal per-event record; only the deduplicated survivors become dicts."""
+
+    camera_id: str
+    timestamp: datetime
+    capture_ts: datetime
+    session_id: str | None
+    frame_seq: int | None
+    detections: List[Dict[str, Any]]
+    models: List[Any]
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "camera_id": self.camera_id,
+            "timestamp": self.timestamp,
+            "capture_ts": self.capture_ts,
+            "session_id": self.session_id,
+            "frame_seq": self.frame_seq,
+            "detections": self.detections,
+            "models": self.models,
+        }
+
+
 @dataclass
 class IngestionResult:
     """Normalized ingestion output."""
@@ -54,18 +78,19 @@ class DefaultIngestionEngine(BaseIngestionEngine):
         if configured_max_age is None:
             configured_max_age = getattr(context.config, "edge_event_max_age_seconds", 5)
         max_age_seconds = self._max_age_seconds or configured_max_age
-        max_age = timedelta(seconds=max_age_seconds)
-        now = datetime.now(timezone.utc)
+        # 以單一截止時間比較，避免每筆事件都做 timedelta 減法
+        cutoff = datetime.now(timezone.utc) - timedelta(seconds=max_age_seconds)
+        normalize = self._normalize_event
 
-        latest_events: Dict[str, Dict[str, Any]] = {}
+        latest_events: Dict[str, _NormalizedEvent] = {}
         dropped = 0
         duplicate_count = 0
         for item in raw_events:
-            parsed = self._normalize_event(item, now, max_age)
+            parsed = normalize(item, cutoff)
             if parsed is None:
                 dropped += 1
                 continue
-            camera_id = parsed["camera_id"]
+            camera_id = parsed.camera_id
             current = latest_events.get(camera_id)
             if current is None or self._is_more_recent(parsed, current):
                 latest_events[camera_id] = parsed
@@ -80,7 +105,7 @@ class DefaultIngestionEngine(BaseIngestionEngine):
                 continue
             self._last_seen_by_camera[camera_id] = frame_identity
             dirty_camera_ids.append(camera_id)
-            deduped_events.append(parsed)
+            deduped_events.append(parsed.to_dict())
 
         return IngestionResult(
             events=deduped_events,
@@ -110,17 +135,14 @@ class DefaultIngestionEngine(BaseIngestionEngine):
     @staticmethod
     def _normalize_event(
         item: Dict[str, Any],
-        now: datetime,
-        max_age: timedelta,
-    ) -> Dict[str, Any] | None:
+        cutoff: datetime,
+    ) -> _NormalizedEvent | None:
         camera_id = item.get("camera_id")
         timestamp_str = item.get("timestamp")
-        if not camera_id or not timestamp_str:
+        if not (camera_id and timestamp_str):
             return None
         event_time = DefaultIngestionEngine._parse_timestamp(timestamp_str)
-        if event_time is None:
-            return None
-        if now - event_time > max_age:
+        if event_time is None or event_time < cutoff:
             return None
         capture_ts = DefaultIngestionEngine._parse_timestamp(item.get("capture_ts")) or event_time
         session_id = item.get("session_id")
@@ -136,22 +158,22 @@ class DefaultIngestionEngine(BaseIngestionEngine):
             frame_seq = None
         detections = item.get("detections") or []
         models = item.get("models") or []
-        return {
-            "camera_id": camera_id,
-            "timestamp": event_time,
-            "capture_ts": capture_ts,
-            "session_id": session_id,
-            "frame_seq": frame_seq,
-            "detections": detections,
-            "models": models,
-        }
+        return _NormalizedEvent(
+            camera_id=camera_id,
+            timestamp=event_time,
+            capture_ts=capture_ts,
+            session_id=session_id,
+            frame_seq=frame_seq,
+            detections=detections,
+            models=models,
+        )
 
     @staticmethod
-    def _is_more_recent(candidate: Dict[str, Any], current: Dict[str, Any]) -> bool:
-        candidate_session = candidate.get("session_id")
-        current_session = current.get("session_id")
-        candidate_seq = candidate.get("frame_seq")
-        current_seq = current.get("frame_seq")
+    def _is_more_recent(candidate: _NormalizedEvent, current: _NormalizedEvent) -> bool:
+        candidate_session = candidate.session_id
+        current_session = current.session_id
+        candidate_seq = candidate.frame_seq
+        current_seq = current.frame_seq
         if (
             isinstance(candidate_session, str)
             and isinstance(current_session, str)
@@ -161,8 +183,8 @@ class DefaultIngestionEngine(BaseIngestionEngine):
         ):
             return candidate_seq > current_seq
 
-        candidate_time = candidate.get("capture_ts") or candidate["timestamp"]
-        current_time = current.get("capture_ts") or current["timestamp"]
+        candidate_time = candidate.capture_ts or candidate.timestamp
+        current_time = current.capture_ts or current.timestamp
         if candidate_time != current_time:
             return candidate_time > current_time
         if isinstance(candidate_seq, int) and isinstance(current_seq, int):
@@ -170,14 +192,14 @@ class DefaultIngestionEngine(BaseIngestionEngine):
         return False
 
     @staticmethod
-    def _build_event_identity(event: Dict[str, Any]) -> tuple[str, str, str]:
-        session_id = str(event.get("session_id") or "")
-        frame_seq = event.get("frame_seq")
-        event_time = event.get("capture_ts") or event["timestamp"]
+    def _build_event_identity(event: _NormalizedEvent) -> tuple[str, str, str]:
+        session_id = str(event.session_id or "")
+        frame_seq = event.frame_seq
+        event_time = event.capture_ts or event.timestamp
         event_time_key = event_time.isoformat()
         if session_id and isinstance(frame_seq, int):
             return ("frame", session_id, f"{frame_seq}:{event_time_key}")
-        return ("legacy", str(event["camera_id"]), event_time_key)
+        return ("legacy", str(event.camera_id), event_time_key)
 
 
 def load_ingestion_engine(path: str) -> Type[BaseIngestionEngine]:
@@ -1,6 +1,9 @@
 """Ingestion stage task."""
 from __future__ import annotations
 
+from datetime import datetime
+from typing import Any, Dict, List
+
 from smart_workflow import TaskContext, TaskResult
 
 from integration.pipeline.tasks.base import QuietTaskBase
@@ -26,6 +29,8 @@ class IngestionTask(QuietTaskBase):
         context.set_resource("pipeline_dirty_camera_ids", list(result.dirty_camera_ids))
         if result.has_new_data:
             context.set_resource("edge_events_latest", result.events)
+            # 預先算好最新事件時間，phase engine 每輪不必再掃描整批事件
+            context.set_resource("edge_events_max_ts", self._latest_timestamp(result.events))
         store_stage_stats(
             context,
             INGESTION_STATS_RESOURCE,
@@ -56,6 +61,15 @@ class IngestionTask(QuietTaskBase):
             },
         )
 
+    @staticmethod
+    def _latest_timestamp(events: List[Dict[str, Any]]) -> datetime | None:
+        latest: datetime | None = None
+        for event in events:
+            timestamp = event.get("timestamp")
+            if timestamp and (latest is None or timestamp > latest):
+                latest = timestamp
+        return latest
+
     def _init_engine(self, context: TaskContext | None) -> BaseIngestionEngine:
         cfg = getattr(context.config, "ingestion_task", None) if context else None
         engine_path = getattr(cfg, "engine_class", None) if cfg else None
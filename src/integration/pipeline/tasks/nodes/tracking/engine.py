@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import logging
+import sys
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
@@ -77,6 +78,7 @@ class MCMOTEngine:
 
     def _build_detections(self, detections: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
         formatted: List[Dict[str, Any]] = []
+        intern = sys.intern
         for det in detections:
             bbox = det.get("bbox") or det.get("box")
             if not bbox or len(bbox) != 4:
@@ -87,6 +89,9 @@ class MCMOTEngine:
             class_name = det.get("class_name") or det.get("label")
             if class_name is None:
                 continue
+            if type(class_name) is str:
+                # 類別名稱只有少數幾種，intern 後同名字串共用同一個物件
+                class_name = intern(class_name)
             score = det.get("score")
             if score is None:
                 score = det.get("confidence")
@@ -1,12 +1,16 @@
 """MC-MOT integration stage."""
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
 from smart_workflow import TaskContext, TaskResult
 
 from integration.pipeline.tasks.base import QuietTaskBase
 from integration.pipeline.tasks.summary import MC_MOT_STATS_RESOURCE, store_stage_stats
 from integration.pipeline.tasks.nodes.tracking.engine import MCMOTEngine
-from integration.visualization import GlobalMapRenderer, OverlayResult
+
+if TYPE_CHECKING:
+    from integration.visualization import OverlayResult
 
 
 class MCMOTTask(QuietTaskBase):
@@ -99,6 +103,9 @@ class MCMOTTask(QuietTaskBase):
         if vis_cfg is None:
             context.logger.warning("已啟用全局可視化但未載入視覺化設定")
             return
+        # 延後載入，未啟用可視化時不需引入 OpenCV / NumPy
+        from integration.visualization import GlobalMapRenderer
+
         renderer = GlobalMapRenderer(
             vis_cfg=vis_cfg,
             logger=context.logger,
@@ -1,7 +1,6 @@
 """Shared helpers for loading task plugin classes."""
 from __future__ import annotations
 
-import inspect
 from importlib import import_module
 from typing import Type, TypeVar
 
@@ -9,9 +8,15 @@ from smart_workflow import TaskError
 
 T = TypeVar("T")
 
+_PLUGIN_CLASS_CACHE: dict[tuple[str, type], type] = {}
+
 
 def load_plugin_class(path: str, base_class: Type[T], plugin_name: str) -> Type[T]:
     """Load and validate a plugin class from ``module:Class`` or ``module.Class``."""
+    cache_key = (path, base_class)
+    cached = _PLUGIN_CLASS_CACHE.get(cache_key)
+    if cached is not None:
+        return cached
     if ":" in path:
         module_name, class_name = path.split(":", 1)
     elif "." in path:
@@ -21,8 +26,14 @@ def load_plugin_class(path: str, base_class: Type[T], plugin_name: str) -> Type[
 
     module = import_module(module_name)
     attr = getattr(module, class_name, None)
-    if attr is None or not inspect.isclass(attr):
+    if not isinstance(attr, type):
         raise TaskError(f"{plugin_name} 載入失敗：類別不存在：{module_name}.{class_name}")
     if not issubclass(attr, base_class):
         raise TaskError(f"{plugin_name} 載入失敗：類別不相容：{class_name} 需繼承 {base_class.__name__}")
+    _PLUGIN_CLASS_CACHE[cache_key] = attr
     return attr
+
+
+def clear_plugin_class_cache() -> None:
+    """Forget classes resolved by :func:`load_plugin_class`."""
+    _PLUGIN_CLASS_CACHE.clear()
@@ -0,0 +1,12 @@
+"""Global map renderer lifecycle helpers."""
+from __future__ import annotations
+
+from contextlib import suppress
+
+
+def close_global_map_renderer(context) -> None:
+    renderer = context.get_resource("global_map_renderer")
+    if renderer is None:
+        return
+    with suppress(Exception):
+        renderer.close()
@@ -4,8 +4,12 @@ from __future__ import annotations
 import colorsys
 import hashlib
 import math
+import os
+import queue
+import threading
+import time
+import weakref
 from dataclasses import dataclass
-from datetime import datetime
 from pathlib import Path
 from typing import Iterable, List, Mapping, Tuple
 
@@ -17,16 +21,65 @@ from integration.config.visualization import GlobalMapVisualizationConfig
 
 @dataclass
 class OverlayResult:
+    """Render output; ``rendered`` may be reused by the next ``render()`` call."""
+
     image_path: Path | None
     rendered: np.ndarray | None
 
 
+@dataclass(slots=True)
+class _LocalOverlayBatch:
+    """Column-wise local overlay payload; ``distances`` is NaN where no global match exists."""
+
+    camera_ids: List[str]
+    canonical_ids: List[str]
+    local_ids: List[object]
+    global_ids: List[object]
+    points: np.ndarray
+    distances: np.ndarray
+
+
 _DEFAULT_CLASS_PALETTE: dict[str, tuple[int, int, int]] = {
     "person": (0, 255, 0),
     "stacker": (0, 165, 255),
     "forklift": (0, 128, 255),
 }
 
+_LEGEND_CACHE_SIZE = 8
+_BASE_CANVAS_STAT_INTERVAL_SECONDS = 1.0
+_SNAPSHOT_QUEUE_SIZE = 2
+
+
+def _write_snapshot(path: Path, image: np.ndarray, params: list[int], logger) -> bool:
+    # 先寫到同目錄暫存檔再替換，讀取端不會看到寫到一半的快照
+    tmp_path = path.with_name(f".{path.stem}.tmp{path.suffix}")
+    try:
+        if not cv2.imwrite(str(tmp_path), image, params):
+            logger.warning("無法輸出全局地圖快照：%s", path)
+            return False
+        os.replace(tmp_path, path)
+    except Exception as exc:  # pylint: disable=broad-except
+        logger.warning("無法輸出全局地圖快照：%s（%s）", path, exc)
+        return False
+    logger.debug("已輸出全局地圖快照：%s", path)
+    return True
+
+
+def _snapshot_worker(snapshot_queue: queue.Queue, params: list[int], logger) -> None:
+    while True:
+        item = snapshot_queue.get()
+        try:
+            if item is None:
+                return
+            _write_snapshot(item[0], item[1], params, logger)
+        finally:
+            snapshot_queue.task_done()
+
+
+def _stop_snapshot_worker(snapshot_queue: queue.Queue, writer: threading.Thread) -> None:
+    snapshot_queue.put(None)
+    writer.join()
+
 
 class GlobalMapRenderer:
     """Centralized renderer that overlays global/local objects onto the warehouse map."""
@@ -44,7 +97,14 @@ class GlobalMapRenderer:
         self._camera_cfgs = list(vis_cfg.cameras)
         self._allowed_cameras = {camera.camera_id for camera in self._camera_cfgs}
         self._base_canvas: np.ndarray | None = None
-        self._image_mtime: float | None = None
+        self._render_buffer: np.ndarray | None = None
+        self._base_umat: cv2.UMat | None = None
+        self._idle_frame: np.ndarray | None = None
+        self._idle_frame_source: np.ndarray | None = None
+        self._base_umat_source: np.ndarray | None = None
+        self._image_fingerprint: tuple[int, int, int] | None = None
+        self._image_digest: bytes | None = None
+        self._last_stat_time = 0.0
         self._meters_per_pixel_x = 1.0
         self._meters_per_pixel_y = 1.0
         self._global_radius = 4
@@ -59,6 +119,14 @@ class GlobalMapRenderer:
         self._legend_ids: set[str] = set()
         self._seen_global_classes: list[str] = []
         self._seen_global_class_set: set[str] = set()
+        self._legend_cache: dict[tuple, tuple[np.ndarray, np.ndarray]] = {}
+        self._output_dir: Path | None = None
+        self._snapshot_queue: queue.Queue | None = None
+        self._snapshot_closer: weakref.finalize | None = None
+        self._snapshot_ext, self._snapshot_params = self._build_snapshot_params()
+        self._use_opencl = self._init_opencl()
+        self._snapshot_second = -1
+        self._snapshot_stamp = ""
         self._build_camera_color_map()
 
     def render(
@@ -71,18 +139,37 @@ class GlobalMapRenderer:
             return None
         self._configure_canvas(canvas.shape[:2])
 
-        rendered = canvas.copy()
         global_list = list(global_objects)
         local_list = list(local_objects)
-
-        global_count = self._draw_global_objects(rendered, global_list)
+        is_idle = not global_list and not local_list
+        skip_empty_frames = self._render_cfg.skip_empty_frames
+        if is_idle and skip_empty_frames and self._idle_frame is not None and self._idle_frame_source is canvas:
+            # 連續空白幀：沿用上一張空白畫面，不再繪製與輸出；顯示視窗仍需處理事件以免失去回應
+            if self._render_cfg.mode in {"show", "both"}:
+                try:
+                    cv2.waitKey(1)
+                except cv2.error as exc:  # pragma: no cover
+                    self._logger.warning("無法顯示全局地圖視窗：%s", exc)
+            return OverlayResult(image_path=None, rendered=self._idle_frame)
+
+        target = self._prepare_draw_target(canvas)
+
+        global_count = self._draw_global_objects(target, global_list)
         local_payload = self._prepare_local_overlay_objects(local_list, global_list)
-        local_count, used_cameras = self._draw_local_objects(rendered, local_payload)
+        local_count, used_cameras = self._draw_local_objects(target, local_payload)
+        # 圖例混色與輸出都在 CPU 端進行，OpenCL 路徑在此下載一次
+        rendered = target.get() if isinstance(target, cv2.UMat) else target
 
         if self._render_cfg.show_legend:
             self._draw_legend(rendered, focus_cameras=used_cameras)
 
         saved_path = self._finalize(rendered)
+        if skip_empty_frames:
+            if is_idle:
+                self._idle_frame = rendered.copy()
+                self._idle_frame_source = canvas
+            else:
+                self._idle_frame = None
         if saved_path is None and global_count == 0 and local_count == 0:
             self._logger.debug("全局地圖沒有可視化的物件")
         return OverlayResult(image_path=saved_path, rendered=rendered)
@@ -95,20 +182,58 @@ class GlobalMapRenderer:
         if not image_path:
             self._logger.debug("全局地圖未設定影像路徑，略過可視化")
             return None
+        now = time.monotonic()
+        if self._base_canvas is not None and now - self._last_stat_time < _BASE_CANVAS_STAT_INTERVAL_SECONDS:
+            return self._base_canvas
+        self._last_stat_time = now
         path = Path(image_path)
-        if not path.exists():
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
             self._logger.warning("找不到全局地圖影像：%s", path)
             return None
-        mtime = path.stat().st_mtime
-        if self._base_canvas is None or self._image_mtime != mtime:
-            canvas = cv2.imread(str(path))
-            if canvas is None:
-                self._logger.warning("無法載入全局地圖影像：%s", path)
+        fingerprint = (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+        if self._base_canvas is None or self._image_fingerprint != fingerprint:
+            try:
+                data = path.read_bytes()
+            except OSError as exc:
+                self._logger.warning("無法載入全局地圖影像：%s（%s）", path, exc)
                 return None
-            self._base_canvas = canvas
-            self._image_mtime = mtime
+            # mtime 變了但內容沒變（touch、備份還原）時沿用已解碼的底圖
+            digest = hashlib.blake2b(data, digest_size=16).digest()
+            if self._base_canvas is None or digest != self._image_digest:
+                canvas = cv2.imdecode(np.frombuffer(data, dtype=np.uint8), cv2.IMREAD_COLOR)
+                if canvas is None:
+                    self._logger.warning("無法載入全局地圖影像：%s", path)
+                    return None
+                self._base_canvas = canvas
+                self._image_digest = digest
+            self._image_fingerprint = fingerprint
         return self._base_canvas
 
+    def _prepare_draw_target(self, canvas: np.ndarray) -> np.ndarray | cv2.UMat:
+        if self._use_opencl:
+            if self._base_umat is None or self._base_umat_source is not canvas:
+                self._base_umat = cv2.UMat(canvas)
+                self._base_umat_source = canvas
+            return cv2.copyTo(self._base_umat, None)
+        rendered = self._render_buffer
+        if rendered is None or rendered.shape != canvas.shape or rendered.dtype != canvas.dtype:
+            rendered = np.empty_like(canvas)
+            self._render_buffer = rendered
+        np.copyto(rendered, canvas)
+        return rendered
+
+    def _init_opencl(self) -> bool:
+        if not self._render_cfg.use_opencl:
+            return False
+        if not cv2.ocl.haveOpenCL():
+            self._logger.info("未偵測到 OpenCL，全局地圖改用 CPU 繪製")
+            return False
+        cv2.ocl.setUseOpenCL(True)
+        self._logger.info("全局地圖使用 OpenCL 繪製")
+        return True
+
     def _configure_canvas(self, shape: tuple[int, int]) -> None:
         height, width = shape
         min_dim = max(1, min(height, width))
@@ -128,9 +253,13 @@ class GlobalMapRenderer:
 
     def _draw_global_objects(
         self,
-        canvas: np.ndarray,
+        canvas: np.ndarray | cv2.UMat,
         global_objects: Iterable[Mapping],
     ) -> int:
+        show_global_id = self._render_cfg.show_global_id
+        show_class_name = self._render_cfg.show_class_name
+        seen_classes = self._seen_global_class_set
+        radius = self._global_radius
         count = 0
         for obj in global_objects:
             coords = self._extract_global_xy(obj)
@@ -139,20 +268,20 @@ class GlobalMapRenderer:
             x, y = int(round(coords[0])), int(round(coords[1]))
             class_name = obj.get("class_name")
             color = self._color_for_global(class_name)
-            cv2.circle(canvas, (x, y), self._global_radius, color, thickness=-1)
-            label_parts: List[str] = []
-            if class_name and class_name not in self._seen_global_class_set:
-                self._seen_global_class_set.add(str(class_name))
+            cv2.circle(canvas, (x, y), radius, color, thickness=-1)
+            if class_name and class_name not in seen_classes:
+                seen_classes.add(str(class_name))
                 self._seen_global_classes.append(str(class_name))
-            if self._render_cfg.show_global_id and obj.get("global_id") is not None:
+            label_parts: List[str] = []
+            if show_global_id and obj.get("global_id") is not None:
                 label_parts.append(str(obj.get("global_id")))
-            if self._render_cfg.show_class_name and class_name:
+            if show_class_name and class_name:
                 label_parts.append(str(class_name))
             if label_parts:
                 cv2.putText(
                     canvas,
                     "|".join(label_parts),
-                    (x + self._global_radius + 4, y - 4),
+                    (x + radius + 4, y - 4),
                     cv2.FONT_HERSHEY_SIMPLEX,
                     self._global_font_scale,
                     color,
@@ -166,11 +295,17 @@ class GlobalMapRenderer:
         self,
         local_objects: Iterable[Mapping],
         global_objects: Iterable[Mapping],
-    ) -> List[dict]:
+    ) -> _LocalOverlayBatch:
         global_lookup = {
             obj.get("global_id"): obj for obj in global_objects if obj.get("global_id") is not None
         }
-        prepared: List[dict] = []
+        camera_ids: List[str] = []
+        canonical_ids: List[str] = []
+        local_ids: List[object] = []
+        global_ids: List[object] = []
+        points: List[tuple[float, float]] = []
+        ref_points: List[tuple[float, float]] = []
+        missing_ref = (math.nan, math.nan)
         for item in local_objects:
             camera_id = item.get("camera_id")
             if not camera_id:
@@ -182,61 +317,82 @@ class GlobalMapRenderer:
             if coords is None:
                 continue
             global_id = item.get("global_id")
-            distance_m = None
+            ref_xy = None
             if global_id is not None:
                 ref_obj = global_lookup.get(global_id)
                 if ref_obj is not None:
                     ref_xy = self._extract_global_xy(ref_obj)
-                    if ref_xy is not None:
-                        dx = coords[0] - ref_xy[0]
-                        dy = coords[1] - ref_xy[1]
-                        distance_m = self._distance_in_meters(dx, dy)
-            prepared.append(
-                {
-                    "camera_id": str(camera_id),
-                    "canonical_id": canonical_id,
-                    "local_id": item.get("local_id"),
-                    "global_id": global_id,
-                    "point": coords,
-                    "distance_m": distance_m,
-                }
+            camera_ids.append(str(camera_id))
+            canonical_ids.append(canonical_id)
+            local_ids.append(item.get("local_id"))
+            global_ids.append(global_id)
+            points.append(coords)
+            ref_points.append(ref_xy or missing_ref)
+
+        point_array = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+        if points:
+            distances = self._distances_in_meters(
+                point_array,
+                np.asarray(ref_points, dtype=np.float64),
             )
-        return prepared
+        else:
+            distances = np.empty(0, dtype=np.float64)
+        return _LocalOverlayBatch(
+            camera_ids=camera_ids,
+            canonical_ids=canonical_ids,
+            local_ids=local_ids,
+            global_ids=global_ids,
+            points=point_array,
+            distances=distances,
+        )
 
     def _draw_local_objects(
         self,
-        canvas: np.ndarray,
-        local_objects: List[dict],
+        canvas: np.ndarray | cv2.UMat,
+        local_objects: _LocalOverlayBatch,
     ) -> tuple[int, set[str]]:
         rendered = 0
         used_cameras: set[str] = set()
-        for obj in local_objects:
-            point = obj["point"]
-            color = self._color_for_camera(obj["camera_id"], obj["canonical_id"])
-            x = int(round(point[0]))
-            y = int(round(point[1]))
-            cv2.circle(canvas, (x, y), self._local_radius, color, thickness=-1)
+        centers = self._round_points(local_objects.points)
+        radius = self._local_radius
+        offset = radius + 4
+        font = cv2.FONT_HERSHEY_SIMPLEX
+        font_scale = self._local_font_scale
+        thickness = self._local_label_thickness
+        camera_colors = self._camera_colors
+        assign_color = self._assign_fallback_color
+        isnan = math.isnan
+        for (x, y), camera_id, canonical_id, local_id, global_id, distance in zip(
+            centers,
+            local_objects.camera_ids,
+            local_objects.canonical_ids,
+            local_objects.local_ids,
+            local_objects.global_ids,
+            local_objects.distances.tolist(),
+        ):
+            # 設定的 id、別名與所有 fallback id 都已是 _camera_colors 的 key
+            color = camera_colors.get(camera_id) or assign_color(camera_id, canonical_id)
+            cv2.circle(canvas, (x, y), radius, color, thickness=-1)
             label_parts: List[str] = []
-            if obj.get("local_id") is not None:
-                label_parts.append(f"l_{obj.get('local_id')}")
-            if obj.get("global_id") is not None:
-                label_parts.append(f"g_{obj.get('global_id')}")
-            distance = obj.get("distance_m")
-            if distance is not None:
+            if local_id is not None:
+                label_parts.append("l_" + str(local_id))
+            if global_id is not None:
+                label_parts.append("g_" + str(global_id))
+            if not isnan(distance):
                 label_parts.append(f"{distance:.2f}M")
             if label_parts:
                 cv2.putText(
                     canvas,
                     " | ".join(label_parts),
-                    (x + self._local_radius + 4, y - 4),
-                    cv2.FONT_HERSHEY_SIMPLEX,
-                    self._local_font_scale,
+                    (x + offset, y - 4),
+                    font,
+                    font_scale,
                     color,
-                    self._local_label_thickness,
+                    thickness,
                     lineType=cv2.LINE_AA,
                 )
             rendered += 1
-            used_cameras.add(obj["canonical_id"])
+            used_cameras.add(canonical_id)
         if rendered == 0:
             self._logger.debug("沒有符合條件的 local 物件可視化")
         return rendered, used_cameras
@@ -261,65 +417,118 @@ class GlobalMapRenderer:
             sections.extend(camera_entries)
         if not sections:
             return
+        key = tuple(sections)
+        sprite = self._legend_cache.get(key)
+        if sprite is None:
+            if len(self._legend_cache) >= _LEGEND_CACHE_SIZE:
+                self._legend_cache.clear()
+            sprite = self._build_legend_sprite(sections)
+            self._legend_cache[key] = sprite
+        self._blit_legend(canvas, sprite)
+
+    @staticmethod
+    def _build_legend_sprite(
+        sections: List[Tuple[str, str | None, tuple[int, int, int] | None]],
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Pre-render the legend as a premultiplied color layer plus per-pixel map weight."""
         padding = 10
         line_height = 22
         item_count = len([entry for entry in sections if entry[0] != "spacer"])
         width = 240
         height = padding * 2 + line_height * item_count
-        overlay = canvas.copy()
-        top_left = (padding, padding)
-        bottom_right = (padding + width, padding + height)
-        cv2.rectangle(overlay, top_left, bottom_right, (30, 30, 30), thickness=-1)
-        cv2.addWeighted(overlay, 0.4, canvas, 0.6, 0, canvas)
+        font = cv2.FONT_HERSHEY_SIMPLEX
+
+        # 名稱過長時會超出面板，依文字寬度放大 sprite 以免被裁切
+        sprite_width = padding + width + 1
+        for kind, display_name, color in sections:
+            if kind == "title":
+                text_width = cv2.getTextSize(display_name or "", font, 0.6, 1)[0][0]
+                sprite_width = max(sprite_width, padding + 8 + text_width + 2)
+            elif kind == "item" and color is not None and display_name is not None:
+                text_width = cv2.getTextSize(display_name, font, 0.55, 1)[0][0]
+                sprite_width = max(sprite_width, padding + 34 + text_width + 2)
+        sprite_height = padding + height + line_height
+
+        color_layer = np.zeros((sprite_height, sprite_width, 3), dtype=np.uint8)
+        text_mask = np.zeros((sprite_height, sprite_width), dtype=np.uint8)
+        panel_alpha = np.zeros((sprite_height, sprite_width, 1), dtype=np.float32)
+        panel_alpha[padding : padding + height + 1, padding : padding + width + 1] = 0.4
+
         y = padding + line_height - 6
         for kind, display_name, color in sections:
             if kind == "spacer":
                 y += line_height // 2
                 continue
             if kind == "title":
-                cv2.putText(
-                    canvas,
-                    display_name or "",
-                    (padding + 8, y),
-                    cv2.FONT_HERSHEY_SIMPLEX,
-                    0.6,
-                    (255, 255, 255),
-                    1,
-                    lineType=cv2.LINE_AA,
-                )
+                for layer, fill in ((color_layer, (255, 255, 255)), (text_mask, 255)):
+                    cv2.putText(
+                        layer,
+                        display_name or "",
+                        (padding + 8, y),
+                        font,
+                        0.6,
+                        fill,
+                        1,
+                        lineType=cv2.LINE_AA,
+                    )
                 y += line_height
                 continue
             if color is None or display_name is None:
                 continue
-            cv2.rectangle(
-                canvas,
-                (padding + 8, y - 12),
-                (padding + 28, y + 4),
-                color,
-                thickness=-1,
-            )
-            cv2.putText(
-                canvas,
-                display_name,
-                (padding + 34, y),
-                cv2.FONT_HERSHEY_SIMPLEX,
-                0.55,
-                (255, 255, 255),
-                1,
-                lineType=cv2.LINE_AA,
-            )
+            for layer, fill in ((color_layer, color), (text_mask, 255)):
+                cv2.rectangle(
+                    layer,
+                    (padding + 8, y - 12),
+                    (padding + 28, y + 4),
+                    fill,
+                    thickness=-1,
+                )
+            for layer, fill in ((color_layer, (255, 255, 255)), (text_mask, 255)):
+                cv2.putText(
+                    layer,
+                    display_name,
+                    (padding + 34, y),
+                    font,
+                    0.55,
+                    fill,
+                    1,
+                    lineType=cv2.LINE_AA,
+                )
             y += line_height
 
+        # 畫在黑底上的文字已依覆蓋率預乘，再疊上底下半透明的 (30, 30, 30) 面板
+        text_alpha = text_mask.astype(np.float32)[..., None] / 255.0
+        premultiplied = color_layer.astype(np.float32) + (1.0 - text_alpha) * panel_alpha * 30.0
+        keep = (1.0 - text_alpha) * (1.0 - panel_alpha)
+        return premultiplied, keep
+
+    @staticmethod
+    def _blit_legend(canvas: np.ndarray, sprite: tuple[np.ndarray, np.ndarray]) -> None:
+        premultiplied, keep = sprite
+        height = min(premultiplied.shape[0], canvas.shape[0])
+        width = min(premultiplied.shape[1], canvas.shape[1])
+        if height <= 0 or width <= 0:
+            return
+        roi = canvas[:height, :width]
+        blended = roi.astype(np.float32)
+        blended *= keep[:height, :width]
+        blended += premultiplied[:height, :width]
+        np.rint(blended, out=blended)
+        np.clip(blended, 0, 255, out=blended)
+        roi[...] = blended
+
     def _finalize(self, rendered: np.ndarray) -> Path | None:
         saved_path: Path | None = None
         mode = self._render_cfg.mode
-        timestamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
         if mode in {"write", "both"}:
-            output_dir = Path(self._render_cfg.output_dir)
-            output_dir.mkdir(parents=True, exist_ok=True)
-            saved_path = output_dir / f"global_map_{timestamp}.png"
-            cv2.imwrite(str(saved_path), rendered)
-            self._logger.debug("已輸出全局地圖快照：%s", saved_path)
+            output_dir = self._ensure_output_dir()
+            saved_path = output_dir / f"global_map_{self._snapshot_timestamp()}.{self._snapshot_ext}"
+            if not self._render_cfg.async_snapshots:
+                if not _write_snapshot(saved_path, rendered, self._snapshot_params, self._logger):
+                    saved_path = None
+            elif not self._submit_snapshot(saved_path, rendered):
+                self._logger.debug("全局地圖快照佇列已滿，略過本次輸出")
+                saved_path = None
 
         if mode in {"show", "both"}:
             try:
@@ -329,6 +538,64 @@ class GlobalMapRenderer:
                 self._logger.warning("無法顯示全局地圖視窗：%s", exc)
         return saved_path
 
+    def flush(self) -> None:
+        """Block until every queued snapshot has been written."""
+        if self._snapshot_queue is not None:
+            self._snapshot_queue.join()
+
+    def close(self) -> None:
+        """Write out queued snapshots and stop the background writer, if any."""
+        if self._snapshot_closer is not None:
+            self._snapshot_closer()
+            self._snapshot_closer = None
+            self._snapshot_queue = None
+
+    def _submit_snapshot(self, path: Path, rendered: np.ndarray) -> bool:
+        snapshot_queue = self._snapshot_queue
+        if snapshot_queue is None:
+            snapshot_queue = queue.Queue(maxsize=_SNAPSHOT_QUEUE_SIZE)
+            # 背景執行緒不持有 renderer，回收或程式結束時由 finalize 送出結束訊號並等待寫完
+            writer = threading.Thread(
+                target=_snapshot_worker,
+                args=(snapshot_queue, self._snapshot_params, self._logger),
+                name="global-map-snapshot",
+                daemon=True,
+            )
+            writer.start()
+            self._snapshot_queue = snapshot_queue
+            self._snapshot_closer = weakref.finalize(self, _stop_snapshot_worker, snapshot_queue, writer)
+        if snapshot_queue.full():
+            return False
+        # render buffer 會在下一幀重複使用，交給寫檔執行緒的是複本
+        try:
+            snapshot_queue.put_nowait((path, rendered.copy()))
+        except queue.Full:
+            return False
+        return True
+
+    def _ensure_output_dir(self) -> Path:
+        if self._output_dir is None:
+            output_dir = Path(self._render_cfg.output_dir)
+            output_dir.mkdir(parents=True, exist_ok=True)
+            self._output_dir = output_dir
+        return self._output_dir
+
+    def _build_snapshot_params(self) -> tuple[str, list[int]]:
+        snapshot_format = self._render_cfg.snapshot_format
+        quality = self._render_cfg.snapshot_quality
+        if snapshot_format == "png":
+            return "png", [cv2.IMWRITE_PNG_COMPRESSION, 1]
+        if snapshot_format == "webp":
+            return "webp", [cv2.IMWRITE_WEBP_QUALITY, quality]
+        return "jpg", [cv2.IMWRITE_JPEG_QUALITY, quality]
+
+    def _snapshot_timestamp(self) -> str:
+        second = int(time.time())
+        if second != self._snapshot_second:
+            self._snapshot_second = second
+            self._snapshot_stamp = time.strftime("%Y%m%d_%H%M%S", time.gmtime(second))
+        return self._snapshot_stamp
+
     def _build_camera_color_map(self) -> None:
         for camera in self._camera_cfgs:
             color = self._stable_color_from_key(f"camera:{camera.camera_id}")
@@ -351,10 +618,15 @@ class GlobalMapRenderer:
         self._legend_ids.add(camera_id)
         self._legend_entries.append((camera_id, display_name, color))
 
-    def _color_for_camera(self, raw_camera_id: str, canonical_camera_id: str | None = None) -> tuple[int, int, int]:
+    def _assign_fallback_color(
+        self,
+        raw_camera_id: str,
+        canonical_camera_id: str | None = None,
+    ) -> tuple[int, int, int]:
         canonical_id = canonical_camera_id or self._camera_lookup.get(raw_camera_id, raw_camera_id)
-        color = self._camera_colors.get(raw_camera_id) or self._camera_colors.get(canonical_id)
+        color = self._camera_colors.get(canonical_id)
         if color is not None:
+            self._camera_colors[raw_camera_id] = color
             return color
         color = self._stable_color_from_key(f"camera:{canonical_id}")
         self._camera_colors[canonical_id] = color
@@ -370,8 +642,10 @@ class GlobalMapRenderer:
             return self._stable_color_from_key(f"class:{class_name}")
         return (255, 255, 255)
 
-    def _distance_in_meters(self, dx_pixels: float, dy_pixels: float) -> float:
-        return math.hypot(dx_pixels * self._meters_per_pixel_x, dy_pixels * self._meters_per_pixel_y)
+    def _distances_in_meters(self, points: np.ndarray, ref_points: np.ndarray) -> np.ndarray:
+        """Pairwise pixel offsets to meters; rows without a reference come back as NaN."""
+        delta = points - ref_points
+        return np.hypot(delta[:, 0] * self._meters_per_pixel_x, delta[:, 1] * self._meters_per_pixel_y)
 
     def _build_global_legend(self) -> List[Tuple[str, tuple[int, int, int]]]:
         if self._seen_global_classes:
@@ -427,6 +701,13 @@ class GlobalMapRenderer:
         except (TypeError, ValueError):
             return None
 
+    @staticmethod
+    def _round_points(points: List[tuple[float, float]] | np.ndarray) -> List[List[int]]:
+        if len(points) == 0:
+            return []
+        # np.rint 與 round() 同樣四捨六入五成雙，中心點位置不變
+        return np.rint(np.asarray(points, dtype=np.float64)).astype(np.int32).tolist()
+
     @staticmethod
     def _stable_color_from_key(key: str) -> tuple[int, int, int]:
         digest = hashlib.sha1(key.encode("utf-8")).digest()
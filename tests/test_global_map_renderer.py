@@ -0,0 +1,209 @@
+from __future__ import annotations
+
+import logging
+import threading
+from pathlib import Path
+
+import cv2
+import numpy as np
+
+from integration.config.visualization import GlobalMapVisualizationConfig
+from integration.visualization import GlobalMapRenderer
+
+
+def _build_renderer(tmp_path: Path, image: np.ndarray, **render) -> GlobalMapRenderer:
+    image_path = tmp_path / "map.png"
+    cv2.imwrite(str(image_path), image)
+    vis_cfg = GlobalMapVisualizationConfig(
+        map={
+            "image_path": str(image_path),
+            "width_meters": 20.0,
+            "height_meters": 10.0,
+        },
+        render={
+            "mode": "write",
+            "output_dir": str(tmp_path / "output"),
+            **render,
+        },
+        cameras=[
+            {
+                "camera_id": "camera_1",
+                "display_name": "Camera 1",
+                "aliases": ["cam01"],
+            }
+        ],
+    )
+    return GlobalMapRenderer(vis_cfg=vis_cfg, logger=logging.getLogger("global-map-renderer-test"))
+
+
+def test_legend_blends_only_panel_region(tmp_path: Path) -> None:
+    image = np.full((300, 400, 3), 200, dtype=np.uint8)
+    renderer = _build_renderer(tmp_path, image)
+
+    result = renderer.render([], [])
+
+    assert result is not None
+    rendered = result.rendered
+    # 0.4 * (30, 30, 30) + 0.6 * 200 inside the panel, untouched outside it.
+    assert tuple(rendered[12, 200]) == (132, 132, 132)
+    assert tuple(rendered[5, 5]) == (200, 200, 200)
+    assert tuple(rendered[250, 350]) == (200, 200, 200)
+    assert len(renderer._legend_cache) == 1
+
+    renderer.render([], [])
+    assert len(renderer._legend_cache) == 1
+
+
+def test_legend_is_clipped_on_small_maps(tmp_path: Path) -> None:
+    image = np.full((40, 60, 3), 200, dtype=np.uint8)
+    renderer = _build_renderer(tmp_path, image)
+
+    result = renderer.render([], [])
+
+    assert result is not None
+    assert result.rendered.shape == (40, 60, 3)
+    assert tuple(result.rendered[11, 11]) == (132, 132, 132)
+    assert tuple(result.rendered[39, 5]) == (200, 200, 200)
+
+
+def test_base_canvas_stat_is_throttled(tmp_path: Path, monkeypatch) -> None:
+    from integration.visualization import global_map_renderer
+
+    clock = {"now": 100.0}
+    monkeypatch.setattr(global_map_renderer.time, "monotonic", lambda: clock["now"])
+    renderer = _build_renderer(tmp_path, np.full((60, 80, 3), 10, dtype=np.uint8), show_legend=False)
+    assert renderer.render([], []).rendered[50, 70, 0] == 10
+
+    cv2.imwrite(str(tmp_path / "map.png"), np.full((60, 80, 3), 90, dtype=np.uint8))
+    clock["now"] += 0.5
+    assert renderer.render([], []).rendered[50, 70, 0] == 10
+
+    clock["now"] += 1.0
+    assert renderer.render([], []).rendered[50, 70, 0] == 90
+
+
+def test_snapshot_format_controls_output_file(tmp_path: Path) -> None:
+    image = np.full((60, 80, 3), 120, dtype=np.uint8)
+    renderer = _build_renderer(tmp_path, image, snapshot_format="PNG", show_legend=False)
+
+    result = renderer.render([], [])
+    renderer.flush()
+
+    assert result is not None
+    assert result.image_path is not None
+    assert result.image_path.suffix == ".png"
+    assert np.array_equal(cv2.imread(str(result.image_path)), image)
+
+
+def test_snapshot_format_defaults_to_jpeg(tmp_path: Path) -> None:
+    renderer = _build_renderer(tmp_path, np.zeros((60, 80, 3), dtype=np.uint8))
+
+    result = renderer.render([], [])
+    renderer.flush()
+
+    assert result is not None
+    assert result.image_path is not None
+    assert result.image_path.suffix == ".jpg"
+    assert result.image_path.exists()
+
+
+def test_snapshot_writer_does_not_see_later_frames(tmp_path: Path) -> None:
+    image = np.full((60, 80, 3), 40, dtype=np.uint8)
+    renderer = _build_renderer(tmp_path, image, snapshot_format="png", show_legend=False, async_snapshots=True)
+
+    result = renderer.render([], [])
+    result.rendered[...] = 0
+    renderer.flush()
+
+    assert result.image_path is not None
+    assert cv2.imread(str(result.image_path))[50, 70, 0] == 40
+
+
+def test_snapshot_is_written_before_render_returns_by_default(tmp_path: Path) -> None:
+    renderer = _build_renderer(tmp_path, np.zeros((60, 80, 3), dtype=np.uint8))
+
+    result = renderer.render([], [])
+
+    assert result.image_path is not None
+    assert result.image_path.exists()
+    assert renderer._snapshot_queue is None
+    assert [path.name for path in result.image_path.parent.iterdir()] == [result.image_path.name]
+
+
+def test_close_drains_queue_and_stops_snapshot_writer(tmp_path: Path) -> None:
+    renderer = _build_renderer(tmp_path, np.zeros((60, 80, 3), dtype=np.uint8), async_snapshots=True)
+
+    result = renderer.render([], [])
+    renderer.close()
+
+    assert result.image_path.exists()
+    assert not any(thread.name == "global-map-snapshot" for thread in threading.enumerate())
+    renderer.close()
+
+
+def test_base_canvas_is_not_decoded_again_when_content_is_unchanged(tmp_path: Path, monkeypatch) -> None:
+    from integration.visualization import global_map_renderer
+
+    clock = {"now": 100.0}
+    monkeypatch.setattr(global_map_renderer.time, "monotonic", lambda: clock["now"])
+    image = np.full((60, 80, 3), 10, dtype=np.uint8)
+    renderer = _build_renderer(tmp_path, image, show_legend=False)
+    renderer.render([], [])
+    first_canvas = renderer._base_canvas
+
+    cv2.imwrite(str(tmp_path / "map.png"), image)
+    clock["now"] += 2.0
+    renderer.render([], [])
+
+    assert renderer._base_canvas is first_canvas
+
+
+def test_skip_empty_frames_reuses_idle_frame(tmp_path: Path) -> None:
+    renderer = _build_renderer(tmp_path, np.full((60, 80, 3), 50, dtype=np.uint8), skip_empty_frames=True)
+
+    first = renderer.render([], [])
+    renderer.flush()
+    second = renderer.render([], [])
+
+    assert first.image_path is not None
+    assert second.image_path is None
+    assert np.array_equal(first.rendered, second.rendered)
+
+    busy = renderer.render(
+        [{"global_id": "1", "class_name": "person", "trajectory": [{"x": 40.0, "y": 30.0}]}],
+        [],
+    )
+    assert busy.image_path is not None
+    assert renderer.render([], []).image_path is not None
+
+
+def test_later_marker_is_drawn_over_earlier_label(tmp_path: Path) -> None:
+    from integration.visualization.global_map_renderer import _DEFAULT_CLASS_PALETTE
+
+    renderer = _build_renderer(tmp_path, np.full((200, 300, 3), 200, dtype=np.uint8), show_legend=False)
+    objects = [
+        {"global_id": "1234", "class_name": "person", "trajectory": [{"x": 100.0, "y": 100.0}]},
+        {"global_id": "9", "class_name": "forklift", "trajectory": [{"x": 120.0, "y": 92.0}]},
+    ]
+
+    rendered = renderer.render(objects, []).rendered
+    renderer.flush()
+
+    marker = rendered[89:96, 117:124].reshape(-1, 3)
+    assert (marker == np.array(_DEFAULT_CLASS_PALETTE["forklift"], dtype=np.uint8)).all()
+
+
+def test_skip_empty_frames_keeps_display_window_responsive(tmp_path: Path, monkeypatch) -> None:
+    from integration.visualization import global_map_renderer
+
+    calls: list[str] = []
+    monkeypatch.setattr(global_map_renderer.cv2, "imshow", lambda name, image: calls.append("imshow"))
+    monkeypatch.setattr(global_map_renderer.cv2, "waitKey", lambda delay: calls.append("waitKey"))
+    renderer = _build_renderer(
+        tmp_path, np.full((60, 80, 3), 50, dtype=np.uint8), mode="show", skip_empty_frames=True
+    )
+
+    renderer.render([], [])
+    renderer.render([], [])
+
+    assert calls == ["imshow", "waitKey", "waitKey"]
@@ -163,3 +163,30 @@ def test_mcmot_pipeline_skips_followup_nodes_when_ingestion_has_no_new_data() ->
     assert ingestion.calls == 1
     assert second.calls == 0
     assert third.calls == 0
+
+
+def test_ingestion_task_publishes_latest_event_timestamp() -> None:
+    capture_ts = datetime.now(timezone.utc) - timedelta(seconds=2)
+    context = DummyContext(
+        resources={
+            "edge_event_store": _Store(
+                [
+                    [
+                        _edge_event(camera_id="cam-01", session_id="sess-a", frame_seq=1, capture_ts=capture_ts),
+                        _edge_event(
+                            camera_id="cam-02",
+                            session_id="sess-b",
+                            frame_seq=1,
+                            capture_ts=capture_ts + timedelta(seconds=1),
+                        ),
+                    ]
+                ]
+            ),
+        }
+    )
+    task = IngestionTask(context)
+
+    task.run(context)
+
+    latest = context.get_resource("edge_events_latest")
+    assert context.get_resource("edge_events_max_ts") == max(event["timestamp"] for event in latest)
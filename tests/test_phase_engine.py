@@ -0,0 +1,160 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from integration.pipeline.control import phase_engine
+from integration.pipeline.control.phase_engine import DebouncedPhaseEngine
+from integration.pipeline.control.scheduler import Phase
+
+_START = datetime(2026, 1, 1, 11, 59, 0, tzinfo=timezone.utc)
+
+
+class NoonScheduler:
+    """Working before 12:00 of the given time, non_working afterwards."""
+
+    def __init__(self) -> None:
+        self.calls: list[datetime | None] = []
+
+    def current_phase(self, now: datetime | None = None) -> Phase:
+        self.calls.append(now)
+        if now is not None and now.hour < 12:
+            return Phase(name="working", is_working_hours=True)
+        return Phase(name="non_working", is_working_hours=False)
+
+
+class DummyContext:
+    def __init__(self) -> None:
+        self.scheduler = NoonScheduler()
+        self._resources: dict[str, object] = {"scheduler": self.scheduler}
+
+    def get_resource(self, key: str):
+        return self._resources.get(key)
+
+    def set_resource(self, key: str, value) -> None:  # noqa: ANN001
+        self._resources[key] = value
+
+    def require_resource(self, key: str):
+        return self._resources[key]
+
+    def set_latest(self, *timestamps: datetime) -> None:
+        self._resources["edge_events_latest"] = [{"timestamp": ts} for ts in timestamps]
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    state = {"now": _START}
+
+    def fake_now(self, tzinfo=None):  # noqa: ANN001
+        now = state["now"]
+        return now.astimezone(tzinfo) if tzinfo is not None else now.replace(tzinfo=None)
+
+    monkeypatch.setattr(DebouncedPhaseEngine, "_now", fake_now)
+    return state
+
+
+def _build_engine(monkeypatch, **env: str) -> DebouncedPhaseEngine:
+    for key in ("PHASE_STABLE_SECONDS", "EDGE_EVENT_STALE_SECONDS", "EDGE_EVENT_STALE_MODE", "EDGE_EVENT_UNKNOWN_PHASE"):
+        monkeypatch.delenv(key, raising=False)
+    for key, value in env.items():
+        monkeypatch.setenv(key, value)
+    phase_engine._debounce_settings.cache_clear()
+    engine = DebouncedPhaseEngine()
+    phase_engine._debounce_settings.cache_clear()
+    return engine
+
+
+def test_debounced_engine_promotes_pending_phase_after_stable_seconds(monkeypatch, clock) -> None:
+    engine = _build_engine(monkeypatch, PHASE_STABLE_SECONDS="60")
+    context = DummyContext()
+
+    context.set_latest(_START)
+    assert engine.resolve(context).name == "working"
+
+    pending_since = _START + timedelta(seconds=70)
+    context.set_latest(pending_since)
+    clock["now"] = pending_since
+    assert engine.resolve(context).name == "working"
+
+    clock["now"] = pending_since + timedelta(seconds=59)
+    context.set_latest(clock["now"])
+    assert engine.resolve(context).name == "working"
+
+    clock["now"] = pending_since + timedelta(seconds=60)
+    context.set_latest(clock["now"])
+    assert engine.resolve(context).name == "non_working"
+
+
+def test_debounced_engine_freezes_phase_while_events_are_stale(monkeypatch, clock) -> None:
+    engine = _build_engine(monkeypatch, PHASE_STABLE_SECONDS="0", EDGE_EVENT_STALE_SECONDS="30")
+    context = DummyContext()
+
+    context.set_latest(_START)
+    assert engine.resolve(context).name == "working"
+
+    # 候選 phase 已變成 non_working，但事件超過 30 秒未更新時維持原本的穩定 phase
+    stale_event = _START + timedelta(seconds=70)
+    context.set_latest(stale_event)
+    clock["now"] = stale_event + timedelta(seconds=30)
+    assert engine.resolve(context).name == "working"
+    assert engine.resolve(context).name == "working"
+
+    context.set_latest(clock["now"])
+    assert engine.resolve(context).name == "working"
+    assert engine.resolve(context).name == "non_working"
+
+
+def test_debounced_engine_reports_unknown_phase_while_events_are_stale(monkeypatch, clock) -> None:
+    engine = _build_engine(
+        monkeypatch,
+        EDGE_EVENT_STALE_SECONDS="30",
+        EDGE_EVENT_STALE_MODE="unknown",
+        EDGE_EVENT_UNKNOWN_PHASE="offline",
+    )
+    context = DummyContext()
+
+    context.set_latest(_START)
+    assert engine.resolve(context).name == "working"
+
+    clock["now"] = _START + timedelta(seconds=31)
+    phase = engine.resolve(context)
+
+    assert phase == Phase(name="offline", is_working_hours=False)
+
+
+def test_debounced_engine_mixes_aware_event_time_with_now_fallback(monkeypatch, clock) -> None:
+    engine = _build_engine(monkeypatch, PHASE_STABLE_SECONDS="60")
+    context = DummyContext()
+
+    context.set_latest(_START)
+    assert engine.resolve(context).name == "working"
+
+    # 事件時間為 tz-aware，pending 起點沿用事件時間
+    pending_since = _START + timedelta(seconds=70)
+    context.set_latest(pending_since)
+    clock["now"] = pending_since
+    assert engine.resolve(context).name == "working"
+
+    # 沒有事件時 now 為 naive，與 aware 的 pending 起點比較不應出錯
+    context.set_latest()
+    clock["now"] = pending_since + timedelta(seconds=30)
+    assert engine.resolve(context).name == "working"
+
+    clock["now"] = pending_since + timedelta(seconds=60)
+    assert engine.resolve(context).name == "non_working"
+    assert context.scheduler.calls[-1] is None
+
+
+def test_debounced_engine_prefers_precomputed_max_event_time(monkeypatch, clock) -> None:
+    engine = _build_engine(monkeypatch)
+    context = DummyContext()
+    context.set_latest(_START - timedelta(seconds=5), _START + timedelta(seconds=90), _START)
+
+    assert engine.resolve(context).name == "non_working"
+    assert context.scheduler.calls[-1] == _START + timedelta(seconds=90)
+
+    context.set_resource("edge_events_max_ts", _START)
+    engine = _build_engine(monkeypatch)
+    assert engine.resolve(context).name == "working"
+    assert context.scheduler.calls[-1] == _START
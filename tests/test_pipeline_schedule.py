@@ -0,0 +1,141 @@
+from __future__ import annotations
+
+import json
+import logging
+import os
+import sys
+from pathlib import Path
+from types import ModuleType, SimpleNamespace
+
+import pytest
+
+from smart_workflow import BaseTask, TaskError
+
+from integration.pipeline.pipeline import InitPipelineTask
+from integration.pipeline.schedule import PhasePolicy, clear_task_class_cache, load_pipeline_schedule, load_task_class
+
+
+class DemoPipeline(BaseTask):
+    name = "demo_pipeline"
+
+    def __init__(self, context: object | None = None, **kwargs: object) -> None:
+        self.kwargs = kwargs
+
+    def run(self, context: object) -> None:
+        return None
+
+
+class DummyContext:
+    def __init__(self, schedule_path: Path) -> None:
+        self.config = SimpleNamespace(pipeline_schedule_path=str(schedule_path))
+        self.logger = logging.getLogger("pipeline-schedule-test")
+        self._resources: dict[str, object] = {}
+
+    def get_resource(self, key: str):
+        return self._resources.get(key)
+
+    def set_resource(self, key: str, value) -> None:  # noqa: ANN001
+        self._resources[key] = value
+
+
+def _write_schedule(path: Path, interval_seconds: float) -> None:
+    path.write_text(
+        json.dumps(
+            {
+                "pipelines": {"main": {"class": "demo.pipelines:MainPipeline", "kwargs": {"limit": 3}}},
+                "phases": {
+                    "working": {"pipeline": "main", "interval_seconds": interval_seconds},
+                    "non_working": "main",
+                },
+            }
+        ),
+        encoding="utf-8",
+    )
+
+
+def test_load_pipeline_schedule_reuses_parse_until_file_changes(tmp_path: Path) -> None:
+    schedule_path = tmp_path / "schedule.json"
+    _write_schedule(schedule_path, 5)
+
+    pipelines, phases, policies = load_pipeline_schedule(schedule_path)
+    assert pipelines["main"].class_path == "demo.pipelines:MainPipeline"
+    assert phases == {"working": "main", "non_working": "main"}
+    assert policies["working"].interval == 5.0
+
+    phases["extra"] = "main"
+    again_pipelines, again_phases, _ = load_pipeline_schedule(schedule_path)
+    assert again_pipelines["main"] is pipelines["main"]
+    assert "extra" not in again_phases
+
+    _write_schedule(schedule_path, 10)
+    stat = schedule_path.stat()
+    os.utime(schedule_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    _, _, reloaded_policies = load_pipeline_schedule(schedule_path)
+    assert reloaded_policies["working"].interval == 10.0
+
+
+def test_load_pipeline_schedule_reports_missing_file(tmp_path: Path) -> None:
+    with pytest.raises(TaskError, match="找不到 pipeline schedule"):
+        load_pipeline_schedule(tmp_path / "missing.json")
+
+
+def test_phase_policy_should_run_ns_matches_interval() -> None:
+    policy = PhasePolicy(interval_seconds=1.5)
+
+    assert not policy.should_run_ns(1_000_000_000, 2_499_999_999)
+    assert policy.should_run_ns(1_000_000_000, 2_500_000_000)
+    assert PhasePolicy().should_run_ns(5, 5)
+    assert PhasePolicy(interval_seconds=1.5) == policy
+
+
+def test_init_pipeline_builds_only_referenced_pipelines(tmp_path: Path, monkeypatch) -> None:
+    module = ModuleType("demo_pipelines")
+    module.DemoPipeline = DemoPipeline
+    monkeypatch.setitem(sys.modules, "demo_pipelines", module)
+    schedule_path = tmp_path / "schedule.json"
+    schedule_path.write_text(
+        json.dumps(
+            {
+                "pipelines": {
+                    "main": {"class": "demo_pipelines:DemoPipeline", "kwargs": {"limit": 3}},
+                    "unused": {"class": "missing_module_for_test:Pipeline"},
+                },
+                "phases": {"working": "main", "non_working": "main"},
+            }
+        ),
+        encoding="utf-8",
+    )
+    context = DummyContext(schedule_path)
+
+    result = InitPipelineTask().run(context)
+
+    registry = context.get_resource("pipeline_registry")
+    assert result.payload == {"pipelines": ["working", "non_working"]}
+    assert registry["working"] is registry["non_working"]
+    assert registry["working"].kwargs == {"limit": 3}
+
+
+def test_init_pipeline_reports_every_missing_pipeline(tmp_path: Path) -> None:
+    schedule_path = tmp_path / "schedule.json"
+    schedule_path.write_text(
+        json.dumps({"pipelines": {}, "phases": {"working": "a", "non_working": "b"}}),
+        encoding="utf-8",
+    )
+
+    with pytest.raises(TaskError, match="phase working 找不到 pipeline: a；phase non_working 找不到 pipeline: b"):
+        InitPipelineTask().run(DummyContext(schedule_path))
+
+
+def test_load_task_class_caches_resolved_class(monkeypatch) -> None:
+    clear_task_class_cache()
+    module = ModuleType("demo_pipelines")
+    module.DemoPipeline = DemoPipeline
+    monkeypatch.setitem(sys.modules, "demo_pipelines", module)
+    assert load_task_class("demo_pipelines:DemoPipeline") is DemoPipeline
+
+    monkeypatch.delitem(sys.modules, "demo_pipelines")
+    assert load_task_class("demo_pipelines:DemoPipeline") is DemoPipeline
+
+    clear_task_class_cache()
+    with pytest.raises(ModuleNotFoundError):
+        load_task_class("demo_pipelines:DemoPipeline")
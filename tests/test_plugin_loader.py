@@ -7,7 +7,7 @@ import pytest
 
 from smart_workflow import TaskError
 
-from integration.pipeline.tasks.plugin_loader import load_plugin_class
+from integration.pipeline.tasks.plugin_loader import clear_plugin_class_cache, load_plugin_class
 
 
 class BasePlugin:
@@ -53,3 +53,18 @@ def test_load_plugin_class_rejects_wrong_base(monkeypatch) -> None:
 
     with pytest.raises(TaskError, match="Demo Plugin 載入失敗：類別不相容：BadPlugin"):
         load_plugin_class("plugin_mod.BadPlugin", BasePlugin, "Demo Plugin")
+
+
+def test_load_plugin_class_caches_resolved_class(monkeypatch) -> None:
+    clear_plugin_class_cache()
+    module = ModuleType("plugin_mod")
+    module.GoodPlugin = GoodPlugin
+    monkeypatch.setitem(sys.modules, "plugin_mod", module)
+    assert load_plugin_class("plugin_mod.GoodPlugin", BasePlugin, "Demo Plugin") is GoodPlugin
+
+    monkeypatch.delitem(sys.modules, "plugin_mod")
+    assert load_plugin_class("plugin_mod.GoodPlugin", BasePlugin, "Demo Plugin") is GoodPlugin
+
+    clear_plugin_class_cache()
+    with pytest.raises(ModuleNotFoundError):
+        load_plugin_class("plugin_mod.GoodPlugin", BasePlugin, "Demo Plugin")
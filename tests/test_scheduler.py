@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+from datetime import datetime, time, timezone
+
+from integration.config.settings import ScheduleWindow
+from integration.pipeline.control.scheduler import TimeWindowSchedulerEngine
+
+
+def _at(hour: int, minute: int = 0, second: int = 0) -> datetime:
+    return datetime(2026, 1, 1, hour, minute, second, tzinfo=timezone.utc)
+
+
+def test_time_window_engine_merges_overlapping_windows() -> None:
+    engine = TimeWindowSchedulerEngine(
+        [
+            ScheduleWindow(start=time(13, 0), end=time(18, 0)),
+            ScheduleWindow(start=time(8, 0), end=time(12, 0)),
+            ScheduleWindow(start=time(11, 0), end=time(12, 30)),
+            ScheduleWindow(start=time(22, 0), end=time(21, 0)),
+        ],
+        timezone.utc,
+    )
+
+    assert engine.resolve_phase(_at(7, 59, 59)).name == "non_working"
+    assert engine.resolve_phase(_at(8)).name == "working"
+    assert engine.resolve_phase(_at(12, 15)).name == "working"
+    assert engine.resolve_phase(_at(12, 30)).name == "non_working"
+    assert engine.resolve_phase(_at(17, 59, 59)).name == "working"
+    assert engine.resolve_phase(_at(18)).name == "non_working"
+    assert engine.resolve_phase(_at(21, 30)).name == "non_working"
+
+
+def test_time_window_engine_without_windows_is_non_working() -> None:
+    engine = TimeWindowSchedulerEngine([], timezone.utc)
+
+    phase = engine.resolve_phase(_at(9))
+
+    assert phase.name == "non_working"
+    assert phase.is_working_hours is False
+
+
+def test_time_window_engine_reuses_phase_until_next_boundary(monkeypatch) -> None:
+    from integration.pipeline.control import scheduler
+
+    clock = {"tick": 1000.0, "now": _at(11, 59, 30)}
+
+    class FakeDatetime(datetime):
+        @classmethod
+        def now(cls, tz=None):
+            return clock["now"]
+
+    monkeypatch.setattr(scheduler, "monotonic", lambda: clock["tick"])
+    monkeypatch.setattr(scheduler, "datetime", FakeDatetime)
+    engine = TimeWindowSchedulerEngine(
+        [ScheduleWindow(start=time(8, 0), end=time(12, 0))],
+        timezone.utc,
+    )
+
+    assert engine.resolve_phase().name == "working"
+
+    clock["now"] = _at(13)
+    clock["tick"] += 29.0
+    assert engine.resolve_phase().name == "working"
+
+    clock["tick"] += 1.0
+    assert engine.resolve_phase().name == "non_working"
+    assert engine.resolve_phase(_at(9)).name == "working"
+
+
+def test_time_window_engine_rechecks_wall_clock_at_least_every_minute(monkeypatch) -> None:
+    from integration.pipeline.control import scheduler
+
+    clock = {"tick": 1000.0, "now": _at(9)}
+
+    class FakeDatetime(datetime):
+        @classmethod
+        def now(cls, tz=None):
+            return clock["now"]
+
+    monkeypatch.setattr(scheduler, "monotonic", lambda: clock["tick"])
+    monkeypatch.setattr(scheduler, "datetime", FakeDatetime)
+    engine = TimeWindowSchedulerEngine(
+        [ScheduleWindow(start=time(8, 0), end=time(12, 0))],
+        timezone.utc,
+    )
+
+    assert engine.resolve_phase().name == "working"
+
+    # 牆上時間被校正（或夏令時間切換）時，不應沿用到原本推算的邊界
+    clock["now"] = _at(13)
+    clock["tick"] += 59.0
+    assert engine.resolve_phase().name == "working"
+
+    clock["tick"] += 1.0
+    assert engine.resolve_phase().name == "non_working"